@@ -26,9 +26,20 @@ color sites of interest:
 
     - https://color.adobe.com/create/color-wheel
     - https://www.color-hex.com/color-palettes/
+
+The color maps are read-only; each one also has an *_rgb sibling that holds the same colors as
+(red, green, blue) integer tuples so consumers do not need to re-parse the hex strings.
 """
 
-element_fill_colors = {
+from types import MappingProxyType
+
+
+def _h2rgb( hex_color ):
+    """Convert a '#rrggbb' hex color string into a ( red, green, blue ) tuple of ints."""
+    return ( int( hex_color[1:3], 16 ), int( hex_color[3:5], 16 ), int( hex_color[5:7], 16 ) )
+
+
+element_fill_colors = MappingProxyType({
         'ELEMENT' : '#c0c0c0',
         'ALIAS' : '#9f9f9f',
         'UNIT'   : '#000000',
@@ -37,9 +48,9 @@ element_fill_colors = {
         'EXECUTABLE' : '#77ab59',
         'LIBRARY' : '#2b6a97',
         'STRING'   : '#b3cbdc'
-        }
+        })
 
-basic_colors = {
+basic_colors = MappingProxyType({
         'white' : '#ffffff',
         'black' : '#000000',
         'red'   : '#ff0000',
@@ -48,61 +59,165 @@ basic_colors = {
         'yellow' : '#ffff00',
         'purple' : '#ff00ff',
         'cyan'   : '#00ffff'
-        }
+        })
 
 # color brewer dark color set
-dark_colors = {
+dark_colors = MappingProxyType({
         'red' : '#cb181d',
         'purple' : '#6a51a3',
         'green' : '#238b45',
         'blue' : '#2171b5',
         'orange' : '#d94701'
-        }
+        })
 
-light_colors = {
+light_colors = MappingProxyType({
         'red' : '#fb6a4a',
         'purple' : '#9e9ac8',
         'green' : '#74c476',
         'blue' : '#6baed6',
         'orange' : '#fd8d3c'
-        }
+        })
 
-green_colors = {
+green_colors = MappingProxyType({
         'dark'   : '#238b45',
         'normal' : '#74c476',
         'light'  : '#bae4b3',
         'white'  : '#edf8e9',
         'gray'   : '#aaaaaa'
-        }
+        })
 
-blue_colors = {
+blue_colors = MappingProxyType({
         'dark'   : '#00008b',
         'normal' : '#6baed6',
         'light'  : '#63b8ff',
         'white'  : '#eff3ff',
         'gray'   : '#aaaaaa'
-        }
+        })
 
-red_colors = {
+red_colors = MappingProxyType({
         'dark'   : '#cb181d',
         'normal' : '#fb6a4a',
         'light'  : '#fcae91',
         'white'  : '#fee5d9',
         'gray'   : '#aaaaaa'
-        }
+        })
 
-purple_colors = {
+purple_colors = MappingProxyType({
         'darkest': '#313178',
         'dark'   : '#4e4e94',
         'normal' : '#7474b0',
         'light'  : '#a1a1ce',
         'white'  : '#cfcfe8',
-        }
+        })
 
-orange_colors = {
+orange_colors = MappingProxyType({
         'darkest': '#633a00',
         'dark'   : '#c45f00',
         'normal' : '#ff6f00',
         'light'  : '#ffb38a',
         'white'  : '#ffd7b5',
-        }
\ No newline at end of file
+        })
+
+# precomputed ( red, green, blue ) versions of the color maps above.
+element_fill_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in element_fill_colors.items() })
+basic_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in basic_colors.items() })
+dark_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in dark_colors.items() })
+light_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in light_colors.items() })
+green_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in green_colors.items() })
+blue_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in blue_colors.items() })
+red_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in red_colors.items() })
+purple_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in purple_colors.items() })
+orange_colors_rgb = MappingProxyType({ name : _h2rgb( hex_color ) for name, hex_color in orange_colors.items() })
+
+# The shaded palettes packed into one ( palette, shade, rgb ) uint8 array. Not every palette has every
+# shade, so palette_mask marks which ( palette, shade ) cells hold a real color.
+_shaded_palettes_rgb = {
+        'green'  : green_colors_rgb,
+        'blue'   : blue_colors_rgb,
+        'red'    : red_colors_rgb,
+        'purple' : purple_colors_rgb,
+        'orange' : orange_colors_rgb
+        }
+
+palette_names = tuple( _shaded_palettes_rgb )
+shade_names = ( 'darkest', 'dark', 'normal', 'light', 'white', 'gray' )
+
+palette_index = MappingProxyType({ name : i for i, name in enumerate( palette_names ) })
+shade_index = MappingProxyType({ name : i for i, name in enumerate( shade_names ) })
+
+_palettes_rgb = None
+_palette_mask = None
+
+
+def get_palettes_rgb():
+    """Return the shaded palettes as a single contiguous numpy uint8 array.
+
+    Numpy is imported here rather than at the top of the module so that building a master struct
+    does not require numpy to be installed; it is only needed by the graphing side of the tool.
+
+    Returns:
+        A pair: ( palettes, mask ) where palettes has shape ( len(palette_names), len(shade_names), 3 )
+        and mask is a boolean array of shape ( len(palette_names), len(shade_names) ) that is True where
+        the palette defines that shade. Index them with palette_index and shade_index.
+    """
+    global _palettes_rgb
+    global _palette_mask
+
+    if _palettes_rgb is None:
+        import numpy as np
+
+        palettes = np.zeros( ( len(palette_names), len(shade_names), 3 ), dtype=np.uint8 )
+        mask = np.zeros( ( len(palette_names), len(shade_names) ), dtype=bool )
+
+        for name, palette in _shaded_palettes_rgb.items():
+            for shade, rgb in palette.items():
+                palettes[ palette_index[name], shade_index[shade] ] = rgb
+                mask[ palette_index[name], shade_index[shade] ] = True
+
+        palettes.setflags( write=False )
+        mask.setflags( write=False )
+        _palettes_rgb, _palette_mask = palettes, mask
+
+    return _palettes_rgb, _palette_mask
+
+_nearest_lut = None
+
+
+def nearest_palette_index( r, g, b ):
+    """Return the shaded palette entry closest to the color ( r, g, b ).
+
+    Lookups go through a 32x32x32 table (each channel is reduced to its top 5 bits) that is built
+    the first time this is called, so each query is a single array index.
+
+    Args:
+        r, g, b: the color channels as ints in [0, 255].
+
+    Returns:
+        An index into get_palettes_rgb()[0].reshape( -1, 3 ); divmod( index, len(shade_names) ) gives
+        the ( palette_index, shade_index ) pair.
+
+    Raises:
+        ValueError: if any channel is outside [0, 255].
+    """
+    global _nearest_lut
+
+    if not ( 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255 ):
+        raise ValueError( f'color channels must be in [0, 255]: ( {r}, {g}, {b} )' )
+
+    if _nearest_lut is None:
+        import numpy as np
+
+        palettes, mask = get_palettes_rgb()
+        flat_index = np.flatnonzero( mask )
+        candidates = palettes.reshape( -1, 3 )[ flat_index ].astype( np.int32 )
+
+        # the center of each coarse cell, in the same ( r << 10 | g << 5 | b ) order used for lookups.
+        coarse = np.arange( 32, dtype=np.int32 ) * 8 + 4
+        centers = np.stack( np.meshgrid( coarse, coarse, coarse, indexing='ij' ), axis=-1 ).reshape( -1, 1, 3 )
+
+        distances = ( ( centers - candidates ) ** 2 ).sum( axis=2 )
+        lut = flat_index[ distances.argmin( axis=1 ) ].astype( np.uint8 )
+        lut.setflags( write=False )
+        _nearest_lut = lut
+
+    return int( _nearest_lut[ ( ( r >> 3 ) << 10 ) | ( ( g >> 3 ) << 5 ) | ( b >> 3 ) ] )
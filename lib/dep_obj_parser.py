@@ -64,9 +64,33 @@ class DepMapUnit:
         file they point to. If the links were followed instead we would have an incomplete picture of what
         systemd is actually seeing.
     """
+    dep_attr_pairs = tuple( (key.lower(), value) for key, value in rev_dep_map.items() )
+    """(attribute, reverse dependency) pairs used by create_dep_tups(), in rev_dep_map order."""
+
     # DO NOT MODIFY THE CASE FOR THESE STRINGS. This is required to verify proper options in unit files.
     dep_creating_dirs = ['Wants', 'Requires']
 
+    # Every attribute a DepMapUnit can carry is known up front (see __init__), so drop the per-instance
+    # __dict__.  Dependency maps hold one of these per unit file, and slot access is cheaper in the parsing loops.
+    __slots__ = (
+        'unit_name', 'parent_unit_path', 'parent_unit', 'rev_dep',
+        'parents', 'reverse_deps', 'dependencies', 'commands', 'where',
+        *( key.lower() for key in rev_dep_map ),
+        *rev_dep_map.values()
+    )
+
+    # Candidate names for _find_significant_attributes(), so it does not have to scan dir(self).  'rev_deps' and
+    # 'all' keep the sorted order dir() gave them.
+    _for_dep_pairs = tuple( (key, key.lower()) for key in rev_dep_map )
+    _rev_dep_attrs = tuple( sorted( set( rev_dep_map.values() ) ) )
+    _all_attrs = tuple( sorted( {
+        'unit_name', 'parents', 'reverse_deps', 'dependencies', 'commands', 'where',
+        *( key.lower() for key in rev_dep_map ),
+        *rev_dep_map.values()
+    } ) )
+    # Attributes that hold dependency sets; unit file options and dep map entries are loaded into these.
+    _set_attrs = frozenset( _all_attrs ) - {'unit_name'}
+
     def __init__(self, unit_file: str, parent_unit_path: str, rev_dep: str) -> None:
         """Create the dep object shell for dep map units.
          
@@ -75,20 +99,13 @@ class DepMapUnit:
         """
         self.unit_name = unit_file
         self.parent_unit_path = parent_unit_path
-        self.parent_unit = self.parent_unit_path.split('/')[-1]
+        self.parent_unit = parent_unit_path.rpartition('/')[2]
         self.rev_dep = rev_dep
 
-        # Create an attribute for each dep and rev_dep
-        for key, value in self.rev_dep_map.items():
-            setattr(self, key.lower(), set())
-            setattr(self, value, set())
-        
-        # These are all inferred by other dep/rev_dep types, so they are mapped independently
-        self.parents: Set[str] = set()
-        self.reverse_deps: Set[str] = set()
-        self.dependencies: Set[str] = set()
-        self.commands: Set[str] = set()
-        self.where: Set[str] = set()
+        # Create an empty set for each dep and rev_dep, and for parents, reverse_deps, dependencies, commands
+        # and where, which are all inferred by other dep/rev_dep types.
+        for attribute in self._set_attrs:
+            setattr(self, attribute, set())
 
         self.set_rev_dep()
 
@@ -116,24 +133,33 @@ class DepMapUnit:
         attribute_list = []
 
         if mapping == 'for_deps':
-            for key in self.rev_dep_map:
-                if len( getattr(self, key.lower()) ) > 0:
-                    attribute_list.append( (key, key.lower()) )
+            return [ pair for pair in self._for_dep_pairs if len( getattr(self, pair[1]) ) > 0 ]
         elif mapping == 'rev_deps':
-            return [ attr for attr in dir(self) if
-                ( attr in self.rev_dep_map.values() ) and
-                ( isinstance( getattr(self, attr), set ) and len( getattr(self, attr)) > 0 )
+            return [ attr for attr in self._rev_dep_attrs if
+                isinstance( getattr(self, attr), (set, frozenset) ) and len( getattr(self, attr) ) > 0
                 ]
         elif mapping == 'all':
-            return [ attr for attr in dir(self) if 
-                attr == 'unit_name' or 
-                ( isinstance( getattr(self, attr), set ) and len( getattr(self, attr) ) > 0)
+            return [ attr for attr in self._all_attrs if
+                attr == 'unit_name' or
+                ( isinstance( getattr(self, attr), (set, frozenset) ) and len( getattr(self, attr) ) > 0 )
                 ]
         else:
             logging.warning(f'Invalid mapping type for significant attributes.')
 
         return attribute_list
 
+    def freeze(self) -> None:
+        """Replace every set attribute with a frozenset once parsing is finished.
+
+        Optional; map_dependencies() does not call this.  After it, record() and create_dep_tups() still
+        work, but any further load_from_*() or set_rev_dep() calls will fail.  Only the sets are frozen:
+        record() still returns a new, mutable dict each time it is called.
+        """
+        for attr in self.__slots__:
+            value = getattr(self, attr)
+            if isinstance(value, set):
+                setattr(self, attr, frozenset(value))
+
     def set_rev_dep(self) -> None:
         """Record any reverse dependency being passed when a DepMapUnit object is created."""
         if self.parent_unit_path != 'None':
@@ -193,25 +219,30 @@ class DepMapUnit:
         already been recorded. ms_unit_struct can either be full ms_unit_struct or the metadata
         metadata dict within the ms_unit_struct in order to check for implicit dependencies.
         """
-        for option in ms_unit_struct:
-            try:
-                getattr(self, option.lower()).update(ms_unit_struct[option])
+        set_attrs = self._set_attrs
+        command_directives = unit_file_lists.command_directives
+        # bound once; these are called for most of the options.
+        dependencies_update = self.dependencies.update
+        commands_update = self.commands.update
+        for option, values in ms_unit_struct.items():
+            attribute = option.lower()
+            if attribute in set_attrs:
+                getattr(self, attribute).update(values)
                 if option != 'Where':
-                    self.dependencies.update(ms_unit_struct[option])
-            except AttributeError:
-                # Send metadata entries back into the function as a new dictionary
-                if option == 'metadata':
-                    self.update_ms_unit_file(ms_unit_struct['metadata'])
-                elif option == 'file_type':
-                    return
-                else:
-                    logging.debug(f'No set in the dep_to_attr_map matches {option} (from {ms_unit_struct[option]})')
-
-            if option in unit_file_lists.command_directives:
-                if len(ms_unit_struct[option]) < 1:
+                    dependencies_update(values)
+            # Send metadata entries back into the function as a new dictionary
+            elif option == 'metadata':
+                self.update_ms_unit_file(values)
+            elif option == 'file_type':
+                return
+            else:
+                logging.debug('No set in the dep_to_attr_map matches %s (from %s)', option, values)
+
+            if option in command_directives:
+                if len(values) < 1:
                     continue
 
-                self.commands.update( ms_unit_struct[option] )
+                commands_update( values )
 
     def load_from_dep_map(self, dep_map_unit: Dict[str, Any]) -> None:
         """Load previously recorded unit file info.
@@ -222,13 +253,14 @@ class DepMapUnit:
         with the same name. This duplication may happen when dep tups have the same dep unit,
         but different parents.
         """
+        set_attrs = self._set_attrs
         for dep in dep_map_unit:
-            try:
-                getattr(self, dep.lower()).update(dep_map_unit[dep])
+            attribute = dep.lower()
+            if attribute in set_attrs:
+                getattr(self, attribute).update(dep_map_unit[dep])
 
-            except AttributeError:
-                if dep not in ('unit_name', 'binaries', 'libraries', 'files', 'strings', 'mount_points'):
-                    logging.warning(f'Could not load "{dep}" attribute from unit already in dep map. Investigate {self.unit_name} in the master struct')
+            elif dep not in ('unit_name', 'binaries', 'libraries', 'files', 'strings', 'mount_points'):
+                logging.warning(f'Could not load "{dep}" attribute from unit already in dep map. Investigate {self.unit_name} in the master struct')
 
     def create_dep_tups(self, current_item: str) -> List[tuple]:
         """Create a new dependency tuple for any populated dependency attribute.
@@ -239,14 +271,10 @@ class DepMapUnit:
         anything.  Instead, map_dependencies() in systemd_mapping.py keeps track of
         dependency tuple duplicates.
         """
-        dep_tup_list = []
-
-        for key, attribute in self.get_significant_attributes('for_deps'):
-            for dep in getattr(self, attribute):
-                dep_tup = (dep.split('/')[-1], current_item, self.rev_dep_map[key])
-                dep_tup_list.append(dep_tup)
-
-        return dep_tup_list
+        return [
+            (dep.rpartition('/')[2], current_item, rev_dep)
+            for attribute, rev_dep in self.dep_attr_pairs for dep in getattr(self, attribute)
+            ]
 
     def record(self) -> Dict[str, Union[str, List[str]]]:
         """Return a dictionary of metadata describing all dependencies for a unit file.
@@ -25,12 +25,63 @@ Description:  This module parses a master struct to create a graph of all unit f
 """
 
 import re
+import weakref
 
-from pathlib import Path
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
 
 from . import colors
 from lib import unit_file_lists
 
+# Colors used by the vertex and edge attribute builders; looked up once here instead of on every call.
+_BLACK          = colors.basic_colors['black']
+_WHITE          = colors.basic_colors['white']
+_LIGHT_BLUE     = colors.light_colors['blue']
+_DARK_BLUE      = colors.dark_colors['blue']
+_DARK_GREEN     = colors.green_colors['dark']
+_LIGHT_GREEN    = colors.green_colors['light']
+_DARK_PURPLE    = colors.purple_colors['dark']
+_DARK_ORANGE    = colors.orange_colors['dark']
+_FILL_ALIAS     = colors.element_fill_colors['ALIAS']
+_FILL_UNIT      = colors.element_fill_colors['UNIT']
+_FILL_DROPIN    = colors.element_fill_colors['DROPIN']
+_FILL_COMMAND   = colors.element_fill_colors['COMMAND']
+_FILL_EXECUTABLE = colors.element_fill_colors['EXECUTABLE']
+_FILL_LIBRARY   = colors.element_fill_colors['LIBRARY']
+_FILL_STRING    = colors.element_fill_colors['STRING']
+
+# Matches templated unit names, e.g., getty@tty1.service; shared by Unit and DropInFile edge construction.
+template_match = re.compile( r'\S+@\S+\.\S+' ).fullmatch
+
+def is_template_name( name ):
+    """Return True when name is a templated unit name.
+
+    Most unit names have no '@', so that cheap test runs first and the regex only confirms the candidates.
+    """
+    return '@' in name and template_match( name ) is not None
+
+@lru_cache( maxsize=None )
+def _path_parts( uid ):
+    """Split a master struct path into the pieces the Elements need without building pathlib objects.
+
+    Follows pathlib's rules for name, suffix, and stem (a leading dot does not start a suffix).
+
+    Args:
+        uid: a file path, e.g., /etc/systemd/system/foo.service.d/override.conf
+
+    Returns:
+        A tuple: ( name, parent directory suffix, parent directory stem ), e.g.,
+        ( 'override.conf', '.d', 'foo.service' )
+    """
+    head, _, name = uid.rstrip( '/' ).rpartition( '/' )
+    parent = head.rstrip( '/' ).rpartition( '/' )[2]
+
+    i = parent.rfind( '.' )
+    if 0 < i < len( parent ) - 1:
+        return ( name, parent[i:], parent[:i] )
+    return ( name, '', parent )
+
 class ElementFactory:
     """A class whose instances construct Element instances for use in graphing Systemd
     data.
@@ -49,22 +100,32 @@ class ElementFactory:
         """
         self.remote_path = remote_path
         self.log = log
+        # ( exec directive, command values ) -> Command shared by every unit file with that directive; this lives
+        # only as long as the factory, see clear_command_cache.
+        self.command_cache = {}
+
+    def clear_command_cache( self ):
+        """Forget the Commands shared between the unit files made so far.
+
+        Call this before making elements from a different or changed master structure.
+        """
+        self.command_cache = {}
 
     def make_element( self, uid, data, master_struct ):
         """Make elements (derived from systemd artifacts) that can act as graph nodes.
     
         We use the term Element because these items could be converted into nodes or edges.
 
-        This is a generator because multiple elements can be created from a single unit
-        file.
+        Multiple elements can be created from a single unit file, so a list is returned.
 
         Args:
             uid: The master structure dictionary key that is associated with data
             data: The data dictionary that is associated with uid.
             master_struct: dictionary used for libs, files, and strings for elements
         
-        Yields:
-           Instances of Element type: Alias, DropInFile, Unit, Exec, Directory 
+        Returns:
+           A list of Element instances: Alias, DropInFile, Unit, Exec, Directory; parents always precede
+           their children.
 
         Raises:
             ValueError: if the file_type in the data['metadata'] dictionary is not 
@@ -73,44 +134,96 @@ class ElementFactory:
         ftype = data['metadata']['file_type']
     
         if ftype == 'sym_link':
-            yield Alias( uid, data, self.log )
+            return [ Alias( uid, data, self.log ) ]
     
         elif ftype == 'unit_file':
             # Split out two different items in the graph from a element file type:
             # 1. DropIn "conf" files
             # 2. Systemd Element files
-            p = Path( uid )
-    
-            # p is a file so look at the parent directory suffix.
-            if p.parent.suffix == '.d':
-                # p is a file, p.parent is the directory, and p.parent.suffix allows us to detect
+
+            # uid is a file so look at the parent directory suffix.
+            if _path_parts( uid )[1] == '.d':
+                # uid is a file, its parent is the directory, and the parent suffix allows us to detect
                 # whether this is a Drop In path.
-                elt = DropInFile( uid, data, self.remote_path, master_struct, self.log )
-                yield elt
+                elt = DropInFile( uid, data, self.remote_path, master_struct, self.log, self.command_cache )
 
             else:
                 # p is a unit file that possibly contains directives for working with service processes.
-                elt = Unit( uid, data, self.remote_path, master_struct, self.log )
-                yield elt
-
-            # This is ugly and probably should be refactored with a more elegant solution.
-            for command in elt.get_children():
-                # Unit children are Commands
-                yield command
-                for executables in command.get_children():
-                    # Command children are Executables
-                    yield executables
-                    for libs_and_strings in executables.get_children():
-                        # Executable children are Libraries and Strings
-                        yield libs_and_strings
+                elt = Unit( uid, data, self.remote_path, master_struct, self.log, self.command_cache )
+
+            # Walk the children depth first, in the same order the nested loops used to yield them:
+            # Unit children are Commands, Command children are Executables, and Executable children are
+            # Libraries and Strings (which have no children).
+            elements = []
+            stack = [ elt ]
+            while stack:
+                node = stack.pop()
+                elements.append( node )
+                stack.extend( reversed( node.get_children() ) )
+            return elements
     
         elif ftype == 'dep_dir':
             # dependency directory information is not needed during graph construction; the dependencies
             # will be derived from the Systemd directives.
-            return
+            return []
     
         else:
-            raise ValueError('element file type: {} is not recognized'.format( ftype ) )
+            raise ValueError( f'element file type: {ftype} is not recognized' )
+
+@lru_cache( maxsize=4096 )
+def _unit_key_repr( name ):
+    """Return the repr string (graph vertex id) of the ( name, 'UNIT' ) key that dependency directives refer to.
+
+    The same targets (multi-user.target, basic.target, ...) are referenced by most unit files, so the string is
+    built and interned once per name.
+
+    Args:
+        name: the unit name.
+
+    Returns:
+        repr( ( name, 'UNIT' ) )
+    """
+    return intern( repr( ( name, 'UNIT' ) ) )
+
+@lru_cache( maxsize=4096 )
+def _label_dims( label_length ):
+    """Compute the node ( width, height ) for a label; only the label length matters.
+
+    The width (also used for the label width) is clamped to [100, 300] and the height is at least 30.
+
+    Args:
+        label_length: the number of characters in the label.
+
+    Returns:
+        A pair of floats: ( width, height )
+    """
+    width = min( 300.0, max( 100.0, label_length * 5.0 ) )
+    height = max( 30.0, 15.0 * label_length / 50.0 )
+    return ( width, height )
+
+# Templates for the default Cytoscape attributes; the None entries are filled in per vertex or edge.
+# Copying these keeps the key order stable and avoids looking up the colors on every call.
+_VERTEX_PROTO = {
+    'subgraph': None,
+    'node_label': None,
+    'node_label_color': _BLACK,
+    'node_label_width': None,
+    'node_fill_color': _LIGHT_BLUE,
+    'node_shape': 'ROUND_RECTANGLE',
+    'node_height': None,
+    'node_width': None
+}
+
+_EDGE_PROTO = {
+    'interaction': None,
+    'subgraph': None,
+    'directed': True,
+    'edge_label_color': _BLACK,
+    'source_arrow_shape': 'NONE',
+    'target_arrow_shape': 'DELTA',   # this is more arrow-like.
+    'edge_line_type': 'SOLID',
+    'edge_color': _BLACK
+}
 
 class Element:
     """Instances are single elements in a Systemd graph; this is the base class for all elements in a graph.
@@ -124,8 +237,16 @@ class Element:
     We can look up Elements in a dictionary by their key: ( id, type ) pairs. They have hashcodes and equals methods.
     """
     TypeKey = 'ELEMENT'
-    EdgeDirectives = unit_file_lists.unit_dependency_opts
-    EdgeDirectives.append( 'OnFailure' )
+    __slots__ = ( 'log', '_key', '_repr', 'metadata', 'properties', '_children', '_children_keys' )
+    # The frozensets are for membership tests; the *Ordered tuples keep a stable order for iteration. Copy the
+    # option list instead of appending to it so the shared unit_file_lists module is never modified.
+    EdgeDirectivesOrdered = tuple( intern( d ) for d in ( *unit_file_lists.unit_dependency_opts, 'OnFailure' ) )
+    EdgeDirectives = frozenset( EdgeDirectivesOrdered )
+    SequencingDirectivesOrdered = ( 'After', 'Before' )
+    SequencingDirectives = frozenset( SequencingDirectivesOrdered )
+
+    # ( Element class, edge label ) -> read-only edge attributes; see cached_edge_attrs.
+    _edge_attrs_cache = {}
 
     @staticmethod
     def get_default_vertex_attrs( subgraph, node_label ):
@@ -149,19 +270,69 @@ class Element:
         Returns:
             A dictonary containing the attributes for this vertex; the keys are special.
         """
-        attrs = {}
+        attrs = _VERTEX_PROTO.copy()
 
         attrs['subgraph'] = subgraph
         attrs['node_label'] = node_label
-        attrs['node_label_color'] = colors.basic_colors['black']
-        attrs['node_label_width'] = Element.get_label_width( node_label )
-        attrs['node_fill_color'] = colors.light_colors['blue']
-        attrs['node_shape'] = 'ROUND_RECTANGLE'
-        attrs['node_height'] = Element.get_node_height( node_label )
-        attrs['node_width'] = Element.get_node_width( node_label )
+        width, height = _label_dims( len( node_label ) )
+        attrs['node_label_width'] = width
+        attrs['node_height'] = height
+        attrs['node_width'] = width
+
+        return attrs
+
+    @staticmethod
+    def make_vertex_proto( subgraph, **specifics ):
+        """Build a read-only vertex attribute template for one kind of vertex; see fill_vertex_attrs.
+
+        Args:
+            subgraph: the subgraph (usually a TypeKey) these vertices belong to.
+            specifics: attributes that replace the defaults, e.g., node_fill_color, node_shape.
+
+        Returns:
+            A read-only mapping with every vertex attribute except the label and the sizes.
+        """
+        proto = _VERTEX_PROTO.copy()
+        proto['subgraph'] = subgraph
+        proto.update( specifics )
+        return MappingProxyType( proto )
 
+    @staticmethod
+    def fill_vertex_attrs( proto, node_label ):
+        """Return a copy of a vertex attribute template with the label and the sizes that depend on it filled in.
+
+        Args:
+            proto: a template built by make_vertex_proto.
+            node_label: the label for this vertex.
+
+        Returns:
+            A dictonary containing the attributes for this vertex; the keys are special.
+        """
+        attrs = proto.copy()
+        attrs['node_label'] = node_label
+        width, height = _label_dims( len( node_label ) )
+        attrs['node_label_width'] = width
+        attrs['node_height'] = height
+        attrs['node_width'] = width
         return attrs
 
+    @staticmethod
+    @lru_cache( maxsize=4096 )
+    def cached_default_vertex_attrs( subgraph, node_label ):
+        """Return the default vertex attributes for ( subgraph, node_label ), building them only once.
+
+        The same UNKNOWN and TEMPLATE units are referenced by many unit files. networkx copies the attributes
+        into its own node dictionary, so every reference can pass the same read-only mapping.
+
+        Args:
+            subgraph:
+            node_label:
+
+        Returns:
+            A read-only mapping with the same contents as get_default_vertex_attrs( subgraph, node_label ).
+        """
+        return MappingProxyType( Element.get_default_vertex_attrs( subgraph, node_label ) )
+
     @staticmethod
     def get_default_edge_attrs( subgraph, edge_label ):
         """Return a dictionary containing the default Cytoscape edge attributes
@@ -181,19 +352,32 @@ class Element:
         Returns:
             A dictonary containing the attributes for this edge; the keys are special.
         """
-        attrs = {}
+        attrs = _EDGE_PROTO.copy()
 
         attrs['interaction'] = edge_label
         attrs['subgraph'] = subgraph
-        attrs['directed'] = True
-        attrs['edge_label_color'] = colors.basic_colors['black']
-        attrs['source_arrow_shape'] = 'NONE'
-        attrs['target_arrow_shape'] = 'DELTA'   # this is more arrow-like.
-        attrs['edge_line_type'] = 'SOLID'
-        attrs['edge_color'] = colors.basic_colors['black']
 
         return attrs
 
+    @classmethod
+    def cached_edge_attrs( cls, edge_label ):
+        """Return this Element class's edge attributes for edge_label, building them only once.
+
+        Edge styling only depends on the class and the label, so make_graph_edges can pass the same
+        attributes for every edge; networkx copies them into each edge's own dictionary.
+
+        Args:
+            edge_label: the label (interaction) for the edge.
+
+        Returns:
+            A read-only mapping with the same contents as cls.edge_attrs( edge_label ).
+        """
+        key = ( cls, edge_label )
+        attrs = Element._edge_attrs_cache.get( key )
+        if attrs is None:
+            attrs = Element._edge_attrs_cache[ key ] = MappingProxyType( cls.edge_attrs( edge_label ) )
+        return attrs
+
     @staticmethod
     def get_label_width( label_string ):
         """Compute the width of the label based on the string it will contain.
@@ -204,12 +388,7 @@ class Element:
         Returns:
             The label width as a float
         """
-        width = len( label_string ) * 5.0
-        if width < 100.0:
-            return 100.0
-        elif width > 300.0:
-            return 300.0
-        return width
+        return _label_dims( len( label_string ) )[0]
 
     @staticmethod
     def get_node_height( label_string ):
@@ -221,10 +400,7 @@ class Element:
         Returns:
             The height as a float
         """
-        height = 15.0 * len( label_string )/50.0
-        if height < 30.0:
-            return 30.0
-        return height
+        return _label_dims( len( label_string ) )[1]
 
     @staticmethod
     def get_node_width( label_string ):
@@ -236,12 +412,7 @@ class Element:
         Returns:
             The width as a float
         """
-        width = len( label_string ) * 5.0
-        if width < 100.0:
-            return 100.0
-        elif width > 300.0:
-            return 300.0
-        return width
+        return _label_dims( len( label_string ) )[0]
 
     def __init__( self, uid, data, log ):
         """Constructor for an element
@@ -255,7 +426,7 @@ class Element:
         self.log = log
 
         # Elements are uniquely identified by their UID name (could be a unit name or path) and a type.
-        self._key = ( uid, Element.TypeKey )
+        self._set_key( uid, Element.TypeKey )
 
         # Data derived by our tools.
         self.metadata = {}
@@ -265,10 +436,12 @@ class Element:
 
         # Options and directives provided in Systemd Unit files.
         # this could be the empty dictionary.
-        self.properties = { k : data[k] for k in set( data.keys() ) - { 'metadata' } }
+        self.properties = data.copy()
+        self.properties.pop( 'metadata', None )
 
-        # The set of Element instances that are direct children of this Element.
-        self._children = set()
+        # children and children_keys are filled in on first access.
+        self._children = None
+        self._children_keys = None
 
     def id( self ):
         """Return the ID portion of this Element's key
@@ -286,37 +459,87 @@ class Element:
         """
         return self._key[1]
 
+    def graph_vertex( self ):
+        """Get the vertex this Element adds to a graph.
+
+        Grapher.build adds these for all the Elements made from one master structure entry with a single
+        add_nodes_from call.
+
+        Returns:
+            A ( vertex id, attribute dictionary ) pair.
+        """
+        return ( self._repr, self.vertex_attrs( self.id() ) )
+
     def add_to_graph( self, G ):
-        """An interface definition: Add this Element instance to graph G
+        """Add this Element instance to graph G
 
         Args:
             G: the graph to add this Element to.
         """
-        pass
+        vertex, attrs = self.graph_vertex()
+        G.add_node( vertex, **attrs )
 
-    def get_children_keys( self ):
-        """Return this Element's children as a set of id pairs: ( string id, element type ).
-
-        NOTE: If the get_children method does not return a list of Element instances, this needs to
-        be OVERRIDDEN to provide the correct information (i.e., a pair for instances does not have
-        a key() method.
+    @property
+    def children_keys( self ):
+        """This Element's children as id pairs: ( string id, element type ); computed once.
 
         Returns:
-            A set of pairs of strings; these pairs are expected to be valid keys that can map to 
+            A tuple of pairs of strings; these pairs are expected to be valid keys that can map to 
             instances of Element.
         """
-        return { c.key() for c in self.get_children() }
+        if self._children_keys is None:
+            self._children_keys = self._find_children_keys()
+        return self._children_keys
 
-    def get_children( self ):
-        """Return this Element's children as a set of Element instances.
+    def _find_children_keys( self ):
+        """Build the children_keys tuple.
+
+        NOTE: If the children property does not hold Element instances, this needs to
+        be OVERRIDDEN to provide the correct information (i.e., a pair for instances does not have
+        a key() method.
+        """
+        return tuple( c.key() for c in self.children )
+
+    def get_children_keys( self ):
+        """Return this Element's children as id pairs: ( string id, element type ). See children_keys."""
+        return self.children_keys
 
-        This is meant to be overridden to fill up the children instance variable.
+    @property
+    def children( self ):
+        """This Element's direct children as Element instances; computed on first access and cached.
 
         Returns:
-            The set of children of this Element as Element instances. The directed relationship is ( Element, child )
+            A tuple of unique Element instances. The directed relationship is ( Element, child )
         """
+        if self._children is None:
+            self._children = self._find_children()
         return self._children
 
+    def _find_children( self ):
+        """Build the children tuple. This is meant to be overridden by Elements that have children."""
+        return ()
+
+    def get_children( self ):
+        """Return this Element's direct children. See children."""
+        return self.children
+
+    def _set_key( self, uid, type_key, shared=False ):
+        """Set this Element's key and the repr string derived from it; only constructors should call this.
+
+        Args:
+            uid: the id portion of the key.
+            type_key: the TYPE portion of the key.
+            shared: intern the id and repr strings; use this for elements that recur across many unit files
+                (executables, libraries, strings) so their graph node keys compare by identity.
+        """
+        if shared:
+            uid = intern( uid )
+            self._key = ( uid, type_key )
+            self._repr = intern( repr( self._key ) )
+        else:
+            self._key = ( uid, type_key )
+            self._repr = repr( self._key )
+
     def key( self ):
         """Get this Element's key; once set this should be immutable.
 
@@ -331,15 +554,16 @@ class Element:
         Returns:
             A string that represents this element; the type is written first.
         """
-        return "{}: {}".format( self.get_type(), self.id() )
+        return f"{self._key[1]}: {self._key[0]}"
 
     def __repr__( self ):
         """Get the object representation of this Element
 
         Returns:
-            The repr of the key pair: ( string, string ) that uniquely identifies this Element
+            The repr of the key pair: ( string, string ) that uniquely identifies this Element; this is
+            computed once when the key is set.
         """
-        return repr( self._key )
+        return self._repr
 
     def __hash__( self ):
         """Return the hashcode for this Element
@@ -347,7 +571,7 @@ class Element:
         Returns:
             The hashcode for this Element is the hashcode of its key pair.
         """
-        return hash( self.key() )
+        return hash( self._key )
 
     def __eq__( self, other ):
         """Equals predicate.
@@ -355,11 +579,60 @@ class Element:
         Returns:
             True if this Element is equivalent to other; False otherwise.
         """
+        if self is other:
+            return True
+
         if isinstance( other, Element ):
-            return self.key() == other.key()
+            return self._key == other._key
 
         return NotImplemented
 
+    def get_property_children( self, prop ):
+        """Get the "property" children for this Element. These are Unit Instances that are associated
+        with specific directives in a Unit file's definition.
+
+        Args:
+            prop: The Systemd directive property string to use as a key.
+
+        Returns:
+            The unique Unit keys that are associated with dependency Systemd directives, in the order they
+            are listed in the unit file.
+        """
+        if prop in Element.EdgeDirectives and prop in self.properties:
+            return tuple( dict.fromkeys( ( c, 'UNIT' ) for c in self.properties[ prop ] ) )
+        return ()
+
+    def get_edge_children_by_directive( self ):
+        """Get the "property" children for every dependency directive this Element actually uses.
+
+        Only the directives present in the properties are visited, instead of calling get_property_children
+        for each of the EdgeDirectives.
+
+        Returns:
+            A dictionary mapping each dependency directive found in the properties to its unique Unit keys;
+            the directives are in EdgeDirectivesOrdered order.
+        """
+        props = self.properties
+        return {
+            p: tuple( dict.fromkeys( ( c, 'UNIT' ) for c in props[ p ] ) )
+            for p in Element.EdgeDirectivesOrdered if p in props
+            }
+
+    def get_sequencing_children( self, prop ):
+        """Get the "sequencing" children for this Element. These are Unit Instances that are associated
+        with the After= and Before= directives that establish Unit ordering.
+
+        Args:
+            prop: The Systemd directive property string to use as a key.
+
+        Returns:
+            The unique Unit keys that are associated with sequencing Systemd directives, in the order they
+            are listed in the unit file.
+        """
+        if prop in Element.SequencingDirectives and prop in self.properties:
+            return tuple( dict.fromkeys( ( c, 'UNIT' ) for c in self.properties[ prop ] ) )
+        return ()
+
     def get_data( self, key ):
         """In this Master Structure's metadata mapping, get the object that key maps to.
 
@@ -370,11 +643,11 @@ class Element:
             The object key maps to in the Element's metadata field, or None if the key is
             not in the metadata.
         """
-        try:
+        if key in self.metadata:
             return self.metadata[ key ]
-        except KeyError as error:
-            self.log.warning("Key: {} not in the metadata of this unit.".format( key ))
-            return None
+
+        self.log.warning( "Key: %s not in the metadata of this unit.", key )
+        return None
 
     def set_data( self, key, value ):
         """In this Master Structure's metadata mapping, set the key -> value mapping.
@@ -391,7 +664,7 @@ class Element:
         elif isinstance( self.metadata[ key ], list ):
             self.metadata[ key ].append( value )
         else:
-            self.log.warning("Replacing metadata[ {} ] = {} with {}".format( key, self.metadata[key], value ))
+            self.log.warning( "Replacing metadata[ %s ] = %s with %s", key, self.metadata[key], value )
             self.metadata[ key ] = value
 
     def has_property( self, prop ):
@@ -413,17 +686,20 @@ class Element:
 
         Returns:
             The object key maps to in the Element's Systemd Directives, or None if the key is
-            not in the metadata.
+            not in the metadata. Most units leave most directives unset, so a miss is only logged at debug level.
         """
-        try:
-            return self.properties[ prop ]
-        except (IndexError, KeyError) as error:
-            self.log.warning("Property Key: {} not in the properties of this unit.".format( prop ))
-            return None
+        value = self.properties.get( prop )
+        if value is None:
+            self.log.debug( "Property Key: %s not in the properties of this unit.", prop )
+        return value
 
 class Alias( Element ):
     """A symbolic link to a unit file. The term Alias is used in Systemd documentation.""" 
     TypeKey = 'ALIAS'
+    __slots__ = ( 'source', 'target', 'target_unit' )
+
+    # node_label_color = _WHITE
+    VertexProto = Element.make_vertex_proto( TypeKey, node_fill_color=_FILL_ALIAS, node_shape='ROUND_RECTANGLE' )
 
     @staticmethod
     def vertex_attrs( node_label ):
@@ -435,15 +711,7 @@ class Alias( Element ):
         Returns:
             A dictonary containing the attributes for this vertex; the keys are special.
         """
-        # sets subgraph, node_label, node_label_width, node_height, node_width
-        attrs = Element.get_default_vertex_attrs( Alias.TypeKey, node_label )
-
-        # set the specifics for node_label_color, node_fill_color, node_shape
-        # attrs['node_label_color'] = colors.basic_colors['white']
-        attrs['node_fill_color']  = colors.element_fill_colors[Alias.TypeKey]
-        attrs['node_shape']       = 'ROUND_RECTANGLE'
-
-        return attrs
+        return Element.fill_vertex_attrs( Alias.VertexProto, node_label )
 
     @staticmethod
     def edge_attrs( edge_label=None ):
@@ -462,7 +730,7 @@ class Alias( Element ):
 
         # set the specifics for edge_label_color, edge_line_type, edge_color
         attrs['edge_line_type']     = 'EQUAL_DASH'
-        attrs['edge_color']         = colors.purple_colors['dark']
+        attrs['edge_color']         = _DARK_PURPLE
 
         return attrs
 
@@ -475,10 +743,14 @@ class Alias( Element ):
             log: logger for messaging.
         """
         super().__init__( uid, data, log )
-        self._key = ( self.id(), Alias.TypeKey )
+        self._set_key( self.id(), Alias.TypeKey )
+
+        # sym link entries always record both target fields, so read them straight from the metadata.
+        target_path = self.metadata.get( 'sym_link_target_path', '' )
+        self.target_unit = self.metadata.get( 'sym_link_target_unit' )
 
         self.source = self.id()
-        self.target = "{}{}".format( self.get_data( 'sym_link_target_path' ), self.get_data( 'sym_link_target_unit' ) )
+        self.target = f"{target_path}{self.target_unit}"
 
     def get_vertex_attrs( self ):
         """Return a dictionary containing the Alias Cytoscape vertex attributes
@@ -499,38 +771,36 @@ class Alias( Element ):
         """
         return Alias.edge_attrs( edge_label )
 
-    def get_children_keys( self ):
-        """For an Alias, the children and NOT Element INSTANCES, so we just return the list of pairs of strings."""
-        if not self._children:
-            self.get_children()
-
-        return self._children
-
-    def get_children( self ):
-        if not self._children:
-            self._children.add( ( self.get_data('sym_link_target_unit'), 'UNIT' ) )
-        return self._children
-
-    def add_to_graph( self, G ):
-        """Add this Element instance to graph G
+    def _find_children_keys( self ):
+        """For an Alias, the children and NOT Element INSTANCES, so we just return the pairs of strings."""
+        return self.children
 
-        Args:
-            G: the graph to add this Element to.
-        """
-        G.add_node( repr(self), **Alias.vertex_attrs( self.id() ) )
+    def _find_children( self ):
+        """The unit this Alias points to as a single ( unit name, 'UNIT' ) key pair."""
+        return ( ( self.target_unit, 'UNIT' ), )
 
     def make_graph_edges( self, G ):
-        for c in self.get_children_keys():
-            G.add_edge( repr(self), repr(c), **Alias.edge_attrs( Alias.TypeKey ) )
+        me = self._repr
+        attrs = Alias.cached_edge_attrs( Alias.TypeKey )
+        G.add_edges_from( ( me, repr(c), attrs ) for c in self.get_children_keys() )
 
-class Unit( Element ):
-    """A systemd unit file; Unit Elements are NOT uniquely identified by full path."""
+class UnitLike( Element ):
+    """Shared behaviour for Elements built from systemd unit files (Unit and DropInFile).
+
+    Subclasses supply their TypeKey, the styling class attributes below and how their key is formed;
+    the children and edge construction are the same for both.
+    """
     TypeKey = 'UNIT'
-    TemplateMatcher = re.compile( '^\S+@\S+\.\S+$' )
+    __slots__ = ( 'remote_path', 'master_struct', 'command_cache' )
 
-    @staticmethod
-    def vertex_attrs( node_label ):
-        """Return a dictionary containing the Unit Cytoscape vertex attributes
+    # per-subclass styling used by vertex_attrs and edge_attrs.
+    VertexProto = Element.make_vertex_proto( TypeKey, node_label_color=_WHITE, node_fill_color=_FILL_UNIT, node_shape='RECTANGLE' )
+    _line_type  = 'SOLID'
+    _edge_color = _DARK_GREEN
+
+    @classmethod
+    def vertex_attrs( cls, node_label ):
+        """Return a dictionary containing the Cytoscape vertex attributes for this class
 
         Args:
             node_label:
@@ -538,19 +808,12 @@ class Unit( Element ):
         Returns:
             A dictonary containing the attributes for this vertex; the keys are special.
         """
-        # sets subgraph, node_label, node_label_width, node_height, node_width
-        attrs = Element.get_default_vertex_attrs( Unit.TypeKey, node_label )
+        return Element.fill_vertex_attrs( cls.VertexProto, node_label )
 
-        # set the specifics for node_label_color, node_fill_color, node_shape
-        attrs['node_label_color'] = colors.basic_colors['white']
-        attrs['node_fill_color']  = colors.element_fill_colors[Unit.TypeKey]
-        attrs['node_shape']       = 'RECTANGLE'
+    @classmethod
+    def edge_attrs( cls, edge_label ):
+        """Return a dictionary containing the Cytoscape edge attributes for this class
 
-        return attrs
-
-    @staticmethod
-    def edge_attrs( edge_label ):
-        """Return a dictionary containing the edge Cytoscape edge attributes
         Args:
             edge_label:
 
@@ -558,41 +821,47 @@ class Unit( Element ):
             A dictonary containing the attributes for this edge; the keys are special.
         """
         # sets directed, subgraph, interaction are set here
-        attrs = Element.get_default_edge_attrs( Unit.TypeKey, edge_label )
+        attrs = Element.get_default_edge_attrs( cls.TypeKey, edge_label )
 
-        attrs['edge_line_type']     = 'SOLID'
-        attrs['edge_color']         = colors.green_colors['dark']
+        attrs['edge_line_type']     = cls._line_type
+        attrs['edge_color']         = cls._edge_color
 
         return attrs
 
+    @staticmethod
+    def key_id( uid ):
+        """Return the id part of this class's key for uid; subclasses override this."""
+        return uid
 
-    def __init__( self, path, data, remote_path, master_struct, log ):
+    def __init__( self, uid, data, remote_path, master_struct, log, command_cache = None ):
         """
         Args:
-            path: The unit file's path
+            uid: The unit file's path
             data: The master structure data dictionary.
             remote_path: the base path on this filesystem to the firmware image;
                 needed to file and process any executables within the firmware.
+            master_struct: the master structure this unit file came from.
             log: message logger.
+            command_cache: the ElementFactory's dictionary of shared Commands; None builds unshared Commands.
         """
-        super().__init__( path, data, log )
+        super().__init__( uid, data, log )
 
         self.remote_path = remote_path
         self.master_struct = master_struct
+        self.command_cache = command_cache
 
-        # for files, the uid is just their unit name.
-        self._key = ( Path( path ).name, Unit.TypeKey )
+        self._set_key( self.key_id( uid ), self.TypeKey )
 
     def get_vertex_attrs( self ):
-        """Return a dictionary containing the Unit Cytoscape vertex attributes
+        """Return a dictionary containing the Cytoscape vertex attributes for this Element
 
         Returns:
             A dictonary containing the attributes for this vertex; the keys are special.
         """
-        return Unit.vertex_attrs( self.id() )
+        return self.vertex_attrs( self.id() )
 
     def get_edge_attrs( self, edge_label ):
-        """Return a dictionary containing the Unit Cytoscape edge attributes
+        """Return a dictionary containing the Cytoscape edge attributes for this Element
 
         Args:
             edge_label:
@@ -600,272 +869,128 @@ class Unit( Element ):
         Returns:
             A dictonary containing the attributes for this edge; the keys are special.
         """
-        return Unit.edge_attrs( edge_label )
-
-    def get_children( self ):
-        """Get the set of "direct" children for this Unit. These are Command Element instances.
-
-        Returns:
-            the set of Unit children that are associated with Commands that are executed.
-        """
-        if not self._children:
-            # the child set is empty.
-            for exec_directive in Command.Directives:
-                if self.has_property( exec_directive ):
-                    # this unit contains an "Exec" directive; these will be constructed as distinct nodes.
-                    # each execfile can perform multiple commands although this is not usual.
-                    exec_elt = Command( exec_directive, self.get_property( exec_directive ), self.remote_path, self.master_struct, self.log )
-                    self._children.add( exec_elt )
-
-        return self._children
-
-    def get_property_children( self, prop ):
-        """Get the set of "property" children for this Unit. These are Unit Instances that are associated
-        with specific directives in a Unit file's definition.
-
-        Args:
-            prop: The Systemd directive property string to use as a key.
-
-        Returns:
-            The set of Unit Instances that are associates with dependency Systemd directives.
-        """
-        s = set()
-        if prop in Element.EdgeDirectives and self.has_property( prop ):
-            for c in self.get_property( prop ):
-                s.add( ( c, 'UNIT' ) )
-        return s
-
-    def get_sequencing_children( self, prop ):
-        """Get the set of "sequencing" children for this Unit. These are Unit Instances that are associated
-        with the After= and Before= directives that establish Unit ordering.
-
-        Args:
-            prop: The Systemd directive property string to use as a key.
-
-        Returns:
-            The set of Unit Instances that are associates with sequencing Systemd directives.
-        """
-        s = set()
-        if prop in ('After', 'Before') and self.has_property( prop ):
-            for c in self.get_property( prop ):
-                s.add( ( c, 'UNIT' ) )
-        return s
-
-    def add_to_graph( self, G ):
-        """Add this Element instance to graph G
-
-        Args:
-            G: the graph to add this Element to.
-        """
-        G.add_node( repr(self), **Unit.vertex_attrs( self.id() ) )
+        return self.edge_attrs( edge_label )
+
+    def _find_children( self ):
+        """Build the "direct" children for this unit file. These are Command Element instances.
+
+        Returns:
+            the tuple of children that are associated with Commands that are executed.
+        """
+        # each "Exec" directive in this unit will be constructed as a distinct node.
+        # each execfile can perform multiple commands although this is not usual.
+        # Command keys include the directive, so these are unique without any de-duplication.
+        # Identical directives (common across template instances) share one Command, so its Executable subtree
+        # is only built once.
+        props = self.properties
+        cache = self.command_cache
+        children = []
+        for exec_directive in Command.Directives:
+            exec_list = props.get( exec_directive )
+            if exec_list is None:
+                continue
+            if cache is None:
+                children.append( Command( exec_directive, exec_list, self.remote_path, self.master_struct, self.log ) )
+                continue
+            key = ( exec_directive, tuple( exec_list ) if isinstance( exec_list, list ) else exec_list )
+            cmd = cache.get( key )
+            if cmd is None or cmd.master_struct is not self.master_struct:
+                cmd = cache[ key ] = Command( exec_directive, exec_list, self.remote_path, self.master_struct, self.log )
+            children.append( cmd )
+        return tuple( children )
 
     def make_graph_edges( self, G ):
-        """Creates all the edges (and possibly new nodes) based on information in this Unit Element.
+        """Creates all the edges (and possibly new nodes) based on information in this unit file Element.
 
         Args:
             G: the networkx graph object for this Systemd specification.
         """
-        for c in self.get_children():
-            # Unit edge attributes for now with the label being the type of command.
-            G.add_edge( repr(self), repr(c), **self.get_edge_attrs( c.exec_directive ) )
+        me = self._repr
+
+        # Collect this element's new vertices and edges and hand them to networkx in one batch each.
+        new_nodes = {}
+        # G's node dictionary (a networkx internal); testing it directly skips the Graph.__contains__ call for
+        # every child. Fall back to the public node view if a graph class does not have one.
+        known = getattr( G, '_node', None )
+        if known is None:
+            known = G.nodes
 
-        for p in Element.EdgeDirectives:
-            for c in self.get_property_children( p ):
+        # Unit edge attributes for now with the label being the type of command.
+        edges = [ ( me, c._repr, self.cached_edge_attrs( c.exec_directive ) ) for c in self.get_children() ]
+
+        is_template = is_template_name
+        for p, children in self.get_edge_children_by_directive().items():
+            # every edge for this directive shares one attribute mapping.
+            attrs = self.cached_edge_attrs( p )
+            for c in children:
+                child = _unit_key_repr( c[0] )
 
                 # There are some cases where nodes are created here but NOT normally.
                 # we need to establish their attributes.
-                if repr(c) not in G:
+                if child not in known and child not in new_nodes:
                     label = 'UNKNOWN'
-                    if Unit.TemplateMatcher.match( c[0] ):
+                    if is_template( c[0] ):
                         label = 'TEMPLATE'
-                    G.add_node( repr(c), **Element.get_default_vertex_attrs( label, c[0] ) )
-
-                G.add_edge( repr(self), repr(c), **self.get_edge_attrs( p ) )
-
-        for seq in ( 'After', 'Before' ):
-            for c in self.get_sequencing_children( seq ):
-                if repr(c) not in G:
-                    label = 'UNKNOWN'
-                    G.add_node( repr(c), **Element.get_default_vertex_attrs( label, c[0] ) )
-
-                if seq == 'After':
-                    # this unit comes AFTER the one in the list (edge direction opposite)
-                    G.add_edge( repr(c), repr(self), **self.get_edge_attrs( seq ) )
-                else:
-                    G.add_edge( repr(self), repr(c), **self.get_edge_attrs( seq ) )
-    
-class DropInFile( Element ):
-    """DropIn files are 'unit_file' types that are named using their full path because the name could be duplicated.
+                    new_nodes[ child ] = Element.cached_default_vertex_attrs( label, c[0] )
 
-    These files contain Systemd Directives that may include Exec* directives that should be parsed as well.
-    """
-    TypeKey = 'DROPIN'
-    TemplateMatcher = re.compile( '^\S+@\S+\.\S+$' )
+                edges.append( ( me, child, attrs ) )
 
-    @staticmethod
-    def vertex_attrs( node_label ):
-        """Return a dictionary containing the DropInFile Cytoscape vertex attributes
+        for seq in Element.SequencingDirectivesOrdered:
+            children = self.get_sequencing_children( seq )
+            if not children:
+                continue
 
-        Args:
-            node_label:
+            attrs = self.cached_edge_attrs( seq )
+            # this unit comes AFTER the units listed in After (edge direction opposite)
+            after = seq == 'After'
+            for c in children:
+                child = _unit_key_repr( c[0] )
+                if child not in known and child not in new_nodes:
+                    label = 'UNKNOWN'
+                    new_nodes[ child ] = Element.cached_default_vertex_attrs( label, c[0] )
 
-        Returns:
-            A dictonary containing the attributes for this vertex; the keys are special.
-        """
-        # sets subgraph, node_label, node_label_width, node_height, node_width
-        attrs = Element.get_default_vertex_attrs( DropInFile.TypeKey, node_label )
+                edges.append( ( child, me, attrs ) if after else ( me, child, attrs ) )
 
-        # set the specifics for node_label_color, node_fill_color, node_shape
-        attrs['node_label_color'] = colors.basic_colors['white']
-        attrs['node_fill_color']  = colors.element_fill_colors[DropInFile.TypeKey]
-        attrs['node_shape']       = 'RECTANGLE'
+        G.add_nodes_from( new_nodes.items() )
+        G.add_edges_from( edges )
 
-        return attrs
+class Unit( UnitLike ):
+    """A systemd unit file; Unit Elements are NOT uniquely identified by full path."""
+    TypeKey = 'UNIT'
+    __slots__ = ()
 
     @staticmethod
-    def edge_attrs( edge_label ):
-        """Return a dictionary containing the DropInFile Cytoscape edge attributes
+    def key_id( uid ):
+        """For files, the uid is just their unit name."""
+        return _path_parts( uid )[0]
 
-        Args:
-            edge_label:
+class DropInFile( UnitLike ):
+    """DropIn files are 'unit_file' types that are named using their full path because the name could be duplicated.
 
-        Returns:
-            A dictonary containing the attributes for this edge; the keys are special.
-        """
-        # sets directed, subgraph, interaction are set here
-        attrs = Element.get_default_edge_attrs( DropInFile.TypeKey, edge_label )
+    These files contain Systemd Directives that may include Exec* directives that should be parsed as well.
+    """
+    TypeKey = 'DROPIN'
+    __slots__ = ( 'target', )
 
-        # set the specifics for edge_label_color, edge_line_type, edge_color
-        attrs['edge_line_type']     = 'EQUAL_DASH'
-        attrs['edge_color']         = colors.green_colors['light']
-        return attrs
+    VertexProto = Element.make_vertex_proto( TypeKey, node_label_color=_WHITE, node_fill_color=_FILL_DROPIN, node_shape='RECTANGLE' )
+    _line_type  = 'EQUAL_DASH'
+    _edge_color = _LIGHT_GREEN
 
-    def __init__( self, uid, data, remote_path, master_struct, log ):
+    def __init__( self, uid, data, remote_path, master_struct, log, command_cache = None ):
         """Constructor for a DropInFile Instance
 
         Args:
             uid:
             data:
             remote_path:
+            master_struct:
             log:
+            command_cache: see UnitLike.
         """
-        super().__init__( uid, data, log )
-        self._key = ( uid, DropInFile.TypeKey )
-        self.remote_path = remote_path
-        self.master_struct = master_struct
+        super().__init__( uid, data, remote_path, master_struct, log, command_cache )
 
         # this could be a template instantiation and not exist in our vertex set.
-        self.target = Path( self.id() ).parent.stem
-
-    def get_vertex_attrs( self ):
-        """Return a dictionary containing the DropInFile Cytoscape vertex attributes
-
-        Returns:
-            A dictonary containing the attributes for this vertex; the keys are special.
-        """
-        return DropInFile.vertex_attrs( self.id() )
-
-    def get_edge_attrs( self, edge_label ):
-        """Return a dictionary containing the DropInFile Cytoscape edge attributes
-
-        Args:
-            edge_label:
-
-        Returns:
-            A dictonary containing the attributes for this edge; the keys are special.
-        """
-        return DropInFile.edge_attrs( edge_label )
-
-    def get_children( self ):
-        """Return this DropInFile's children as a set of DropInFile instances.
-
-        Returns:
-            The set of children of this Element as Command instances.
-        """
-        if not self._children:
-            # the child set is empty.
-            for exec_directive in Command.Directives:
-                if self.has_property( exec_directive ):
-
-                    # this unit contains an "Exec" directive; these will be constructed as distinct nodes.
-                    # each execfile can perform multiple commands although this is not usual.
-                    exec_elt = Command( exec_directive, self.get_property( exec_directive ), self.remote_path, self.master_struct, self.log )
-                    self._children.add( exec_elt )
-        return self._children
-
-    def get_property_children( self, prop ):
-        """Get the set of "property" children for this DropInFile. These are Unit Instances that are associated
-        with specific directives in a Unit file's definition.
-
-        Args:
-            prop: The Systemd directive property string to use as a key.
-
-        Returns:
-            The set of Unit Instances that are associates with dependency Systemd directives.
-        """
-        s = set()
-        if prop in Element.EdgeDirectives and self.has_property( prop ):
-            for c in self.get_property( prop ):
-                s.add( ( c, 'UNIT' ) )
-        return s
-
-    def get_sequencing_children( self, prop ):
-        """Get the set of "sequencing" children for this DropInFile. These are Unit Instances that are associated
-        with the After= and Before= directives that establish Unit ordering.
-
-        Args:
-            prop: The Systemd directive property string to use as a key.
-
-        Returns:
-            The set of Unit Instances that are associates with sequencing Systemd directives.
-        """
-        s = set()
-        if prop in ('After', 'Before') and self.has_property( prop ):
-            for c in self.get_property( prop ):
-                s.add( ( c, 'UNIT' ) )
-        return s
-
-    def add_to_graph( self, G ):
-        """Add this Element instance to graph G
-
-        Args:
-            G: the graph to add this Element to.
-        """
-        G.add_node( repr(self), **DropInFile.vertex_attrs( self.id() ) )
-
-    def make_graph_edges( self, G ):
-        """Creates all the edges (and possibly new nodes) based on information in this Unit Element.
-
-        Args:
-            G: the networkx graph object for this Systemd specification.
-        """
-        for c in self.get_children():
-            # Unit edge attributes for now with the label being the type of command.
-            G.add_edge( repr(self), repr(c), **self.get_edge_attrs( c.exec_directive ) )
-
-        for p in Element.EdgeDirectives:
-            for c in self.get_property_children( p ):
-                # There are some cases where nodes are created here but NOT normally.
-                # we need to establish their attributes.
-                if repr(c) not in G:
-                    label = 'UNKNOWN'
-                    if DropInFile.TemplateMatcher.match( c[0] ):
-                        label = 'TEMPLATE'
-                    G.add_node( repr(c), **Element.get_default_vertex_attrs( label, c[0] ) )
-
-                G.add_edge( repr(self), repr(c), **self.get_edge_attrs( p ) )
-
-        for seq in ( 'After', 'Before' ):
-            for c in self.get_sequencing_children( seq ):
-                if repr(c) not in G:
-                    label = 'UNKNOWN'
-                    G.add_node( repr(c), **Element.get_default_vertex_attrs( label, c[0] ) )
-
-                if seq == 'After':
-                    # this unit comes AFTER the one in the list (edge direction opposite)
-                    G.add_edge( repr(c), repr(self), **self.get_edge_attrs( seq ) )
-                else:
-                    G.add_edge( repr(self), repr(c), **self.get_edge_attrs( seq ) )
+        self.target = _path_parts( self.id() )[2]
 
     def get_target( self ):
         return self.target
@@ -876,16 +1001,38 @@ class CommandLine:
 
     This is NOT AN ELEMENT.
     """
+    __slots__ = ( 'cstr', 'prefix_mask', 'executable', 'arguments' )
     SpecialPrefixes = ('@', '-', ':', '+', '!' )
+    PrefixChars = ''.join( SpecialPrefixes )
+    # one bit per prefix; '!!' is a distinct prefix from '!'.
+    PrefixBits = MappingProxyType( { '@': 1, '-': 2, ':': 4, '+': 8, '!': 16, '!!': 32 } )
+    find_bang_runs = re.compile( '!+' ).findall
 
     def __init__( self, cstr ):
         """Constructor for a CommandLine instances"""
         self.cstr = cstr
-        self.prefixes = set()
+        self.prefix_mask = 0
         self.executable = None
         self.arguments = None
         self.__parse_command_string( cstr )
 
+    def has_prefix( self, prefix ):
+        """Check whether this command used one of the special prefixes.
+
+        Args:
+            prefix: one of the SpecialPrefixes or '!!'.
+
+        Returns:
+            True if the prefix was present on the command.
+        """
+        return bool( self.prefix_mask & CommandLine.PrefixBits[ prefix ] )
+
+    @property
+    def prefixes( self ):
+        """The set of special prefixes used on this command."""
+        mask = self.prefix_mask
+        return { p for p, bit in CommandLine.PrefixBits.items() if mask & bit }
+
     def get_executable( self ):
         """Return the executable command string; this usually includes the full path.
 
@@ -918,33 +1065,31 @@ class CommandLine:
         """
         parts = cstr.split(maxsplit=1)
 
-        print("cstr: {} parts: {}".format( cstr, parts ))
-
         # the command may NOT have any arguments.
         if len(parts)>1:
             self.arguments = parts[1]
 
         executable = parts[0]
 
-        i = 0
-        while i < len(executable):
-            if executable[i] in CommandLine.SpecialPrefixes:
-                ch = executable[i]
-                if ch == '!':
-                    try:
-                        if executable[i+1] == '!':
-                            i += 1
-                            ch += '!'
-                    except IndexError:
-                        # end of the executable; this is a problem, but just record the single !
-                        pass
-                self.prefixes.add( ch )
-            else:
-                # we have reached the actual path to the executable.
-                break
-            i += 1
+        # strip the special prefix characters in one pass; whatever was removed is the prefix.
+        stripped = executable.lstrip( CommandLine.PrefixChars )
+        prefix_str = executable[:len(executable) - len(stripped)]
+        bits = CommandLine.PrefixBits
+        mask = 0
+        for ch in prefix_str:
+            mask |= bits[ ch ]
+        if mask & bits['!']:
+            # '!!' is its own prefix: each run of '!' is read as pairs, and an odd one out is a single '!'.
+            mask &= ~bits['!']
+            for run in CommandLine.find_bang_runs( prefix_str ):
+                if len(run) > 1:
+                    mask |= bits['!!']
+                if len(run) % 2:
+                    mask |= bits['!']
+        self.prefix_mask = mask
+
         # set the executable WITHOUT the special prefix characters.
-        self.executable = executable[i:]
+        self.executable = intern( stripped )
 
 class Command( Element ):
     """An Element that represents a SEQUENCE of executable commands (usually only one tho) that are associated with 
@@ -972,6 +1117,10 @@ class Command( Element ):
     !! : also related to PRIVILEDGES
     """
     TypeKey = 'COMMAND'
+    __slots__ = ( 'exec_directive', 'master_struct', 'commands', 'remote_path' )
+
+    # node_label_color = colors.orange_colors['darkest']
+    VertexProto = Element.make_vertex_proto( TypeKey, node_fill_color=_FILL_COMMAND, node_shape='RECTANGLE' )
 
     Directives = ('ExecStart', 'ExecCondition', 'ExecStartPre', 'ExecStartPost', 'ExecReload', 'ExecStop', 'ExecStopPost')
 
@@ -985,14 +1134,7 @@ class Command( Element ):
         Returns:
             A dictonary containing the attributes for this vertex; the keys are special.
         """
-        # sets subgraph, node_label, node_label_width, node_height, node_width
-        attrs = Element.get_default_vertex_attrs( Command.TypeKey, node_label )
-
-        # set the specifics for node_label_color, node_fill_color, node_shape
-        # attrs['node_label_color'] = colors.orange_colors['darkest']
-        attrs['node_fill_color']  = colors.element_fill_colors[Command.TypeKey]
-        attrs['node_shape']       = 'RECTANGLE'
-        return attrs
+        return Element.fill_vertex_attrs( Command.VertexProto, node_label )
 
     @staticmethod
     def edge_attrs( edge_label ):
@@ -1009,7 +1151,7 @@ class Command( Element ):
 
         # set the specifics for edge_label_color, edge_line_type, edge_color
         attrs['edge_line_type']     = 'SOLID'
-        attrs['edge_color']         = colors.orange_colors['dark']
+        attrs['edge_color']         = _DARK_ORANGE
         return attrs
 
     def __init__( self, exec_directive, exec_list, remote_path, master_struct, log ):
@@ -1034,7 +1176,7 @@ class Command( Element ):
         super().__init__( None, dict(), log )
 
         if exec_directive not in Command.Directives:
-            raise Exception("Bad Exec command directive: {}".format( exec_directive ))
+            raise Exception( f"Bad Exec command directive: {exec_directive}" )
 
         self.exec_directive = exec_directive
         self.master_struct = master_struct
@@ -1042,7 +1184,9 @@ class Command( Element ):
         self.commands = list()
         full_command = self.__parse_commands( exec_list )
 
-        self._key = ( full_command, "{}.{}".format( Command.TypeKey, exec_directive[4:].upper() ) )
+        # the composed type strings are built per instance; intern them so every key of the same type shares one
+        # string object and tuple hashing/equality can short-circuit on identity.
+        self._set_key( full_command, intern( f"{Command.TypeKey}.{exec_directive[4:].upper()}" ) )
         self.remote_path = remote_path
 
     def get_vertex_attrs( self ):
@@ -1064,26 +1208,24 @@ class Command( Element ):
         """
         return Command.edge_attrs( edge_label )
 
-    def get_children( self ):
-        """Return this Command's children as a set of Executable instances.
+    def _find_children( self ):
+        """Build this Command's children.
 
         Returns:
-            The set of children of this Command Element as Executable instances.
+            The tuple of children of this Command Element as unique Executable instances.
         """
-        if not self._children:
-            # the child set is empty.
-            for cmd in self.commands:
-                self._children.add( Executable( cmd.get_executable(), self.remote_path, self.master_struct, self.log ) )
-        return self._children
+        return tuple( dict.fromkeys(
+            Executable( cmd.get_executable(), self.remote_path, self.master_struct, self.log ) for cmd in self.commands
+            ) )
 
-    def add_to_graph( self, G ):
-        """Add this Element instance to graph G
+    def graph_vertex( self ):
+        """Get the vertex this Command adds to a graph; each command in the label gets its own line.
 
-        Args:
-            G: the graph to add this Element to.
+        Returns:
+            A ( vertex id, attribute dictionary ) pair.
         """
         label = '\n'.join( self.id().split(';') )
-        G.add_node( repr(self), **Command.vertex_attrs( label ) )
+        return ( self._repr, Command.vertex_attrs( label ) )
 
     def make_graph_edges( self, G ):
         """Creates all the edges based on information in this Unit Element.
@@ -1091,9 +1233,10 @@ class Command( Element ):
         Args:
             G: the networkx graph object for this Systemd specification.
         """
-        for c in self.get_children():
-            # Command edge attributes for now with the label being the type of command.
-            G.add_edge( repr(self), repr(c), **self.get_edge_attrs( Executable.TypeKey ) )
+        me = self._repr
+        # Command edge attributes for now with the label being the type of command.
+        attrs = self.cached_edge_attrs( Executable.TypeKey )
+        G.add_edges_from( ( me, c._repr, attrs ) for c in self.get_children() )
 
     def __parse_commands( self, exec_list ):
         """Parse the list of executable commands that the exec_directive systemd directive maps to.
@@ -1112,13 +1255,10 @@ class Command( Element ):
         Raises:
             Exception when the exec_directive key is NOT in the self.properties map.
         """
-        for cstr in exec_list:
-            # go through each command in the list.
-            if not len(cstr):
-                # JMC: There was a case of an empty command string; for now just skip it.
-                self.log.warning("Empty command string found in directive: {} key: {}".format( self.exec_directive, self.key ))
-            else:
-                self.commands.append( CommandLine( cstr ) )
+        self.commands = [ CommandLine( cstr ) for cstr in exec_list if cstr ]
+        if len( self.commands ) < len( exec_list ):
+            # JMC: There was a case of an empty command string; for now just skip it.
+            self.log.warning( "Empty command string(s) found in directive: %s", self.exec_directive )
 
         full_command = '; '.join( [ str(c) for c in self.commands ] )
         return full_command
@@ -1138,6 +1278,10 @@ class Executable( Element ):
     These tools should be as general as possible, so they can accomodate a variety of architectures.
     """
     TypeKey = 'EXECUTABLE'
+    __slots__ = ( 'remote_path', 'binary_path', 'executable', 'master_struct', 'dlibs', 'fstrings', 'pstrings' )
+
+    # node_label_color = colors.purple_colors['white']
+    VertexProto = Element.make_vertex_proto( TypeKey, node_fill_color=_FILL_EXECUTABLE, node_shape='ROUND_RECTANGLE' )
 
     @staticmethod
     def vertex_attrs( node_label ):
@@ -1147,15 +1291,7 @@ class Executable( Element ):
         Returns:
             the attribute dictionary.
         """
-        # sets subgraph, node_label, node_label_width, node_height, node_width
-        attrs = Element.get_default_vertex_attrs( Executable.TypeKey, node_label )
-
-        # set the specifics for node_label_color, node_fill_color, node_shape
-        # attrs['node_label_color'] = colors.purple_colors['white']
-        attrs['node_fill_color']  = colors.element_fill_colors[Executable.TypeKey]
-        attrs['node_shape']       = 'ROUND_RECTANGLE'
-
-        return attrs
+        return Element.fill_vertex_attrs( Executable.VertexProto, node_label )
 
     @staticmethod
     def edge_attrs( edge_label ):
@@ -1169,7 +1305,7 @@ class Executable( Element ):
 
         # set the specifics for edge_label_color, edge_line_type, edge_color
         attrs['edge_line_type']     = 'SOLID'
-        attrs['edge_color']         = colors.purple_colors['dark']
+        attrs['edge_color']         = _DARK_PURPLE
 
         return attrs
 
@@ -1188,10 +1324,10 @@ class Executable( Element ):
         super().__init__( executable, dict(), log )
 
         self.log = log
-        self._key = ( executable, Executable.TypeKey )
+        self._set_key( executable, Executable.TypeKey, shared=True )
         self.remote_path = remote_path
-        self.binary_path = "{}{}".format( remote_path, executable )
-        self.executable = executable
+        self.binary_path = f"{remote_path}{executable}"
+        self.executable = self._key[0]
         self.master_struct = master_struct
 
         self.dlibs = set()
@@ -1217,29 +1353,16 @@ class Executable( Element ):
         """
         return Executable.edge_attrs( edge_label )
 
-    def get_children( self ):
-        """Return this Command's children as a set of Executable instances.
+    def _find_children( self ):
+        """Build this Executable's children: its Library and String instances.
 
         TODO: This is WHERE WE WOULD AUGMENT WHAT WE RUN AGAINST AN EXECUTABLE TO EXTRACT
         FORENSIC INFORMATION.
 
         Returns:
-            The set of children of this Command Element as Executable instances.
-        """
-        if not self._children:
-            # the child set is empty.
-            self._children.update( self.get_dynamic_libs() )
-            self._children.update( self.get_file_strings() )
-            self._children.update( self.get_path_strings() )
-        return self._children
-
-    def add_to_graph( self, G ):
-        """Add this Element instance to graph G
-
-        Args:
-            G: the graph to add this Element to.
+            The tuple of children of this Executable Element as unique Library and String instances.
         """
-        G.add_node( repr(self), **Executable.vertex_attrs( self.id() ) )
+        return tuple( dict.fromkeys( ( *self.get_dynamic_libs(), *self.get_file_strings(), *self.get_path_strings() ) ) )
 
     def make_graph_edges( self, G ):
         """Creates all the edges based on information in this Command Element.
@@ -1247,10 +1370,13 @@ class Executable( Element ):
         Args:
             G: the networkx graph object for this Systemd specification.
         """
+        s_str = self._repr
+        has_edge = G.has_edge
+        edge_attrs = self.cached_edge_attrs
+        edges = []
         for c in self.get_children():
-            s_str = repr(self)
-            t_str = repr(c)
-            if ( s_str, t_str ) not in G.edges():
+            t_str = c._repr
+            if not has_edge( s_str, t_str ):
                 # When a single Executable is called multiple times, e.g., used with different command line arguments --
                 # lets say we are starting a webserver and stopping a webserver -- same executable multiple commands and options.
                 # there will be multiple edges created from that executable to its supporting libraries and strings.
@@ -1258,7 +1384,9 @@ class Executable( Element ):
                 # This mechanism eliminates THIS PARTICULAR set of multigraph edges.
 
                 # Executable edge attributes for now with the label being the type of command.
-                G.add_edge( s_str, t_str, **self.get_edge_attrs( c.get_type() ) )
+                edges.append( ( s_str, t_str, edge_attrs( c.get_type() ) ) )
+
+        G.add_edges_from( edges )
 
     def get_dynamic_libs( self ):
         """Run a linux command to extract the supporting dynamic libraries (if any) for this executable.
@@ -1275,7 +1403,7 @@ class Executable( Element ):
             # and the executable is a full system path that begins with a /
 
             dlib_names = self.master_struct['libraries'][self.executable]
-            self.dlibs = { Library( name, self.log ) for name in dlib_names }
+            self.dlibs = { Library.shared( name, self.log ) for name in dlib_names }
 
         return self.dlibs
 
@@ -1294,9 +1422,7 @@ class Executable( Element ):
 
             file_strings = self.master_struct['files'][self.executable]
 
-            for s in file_strings:
-                str_elt = String( s.strip(), 'FILE', self.log )
-                self.fstrings.add( str_elt )
+            self.fstrings = { String.shared( s.strip(), 'FILE', self.log ) for s in file_strings }
 
         return self.fstrings
 
@@ -1314,9 +1440,7 @@ class Executable( Element ):
 
             path_strings = self.master_struct['strings'][self.executable]
 
-            for s in path_strings:
-                str_elt = String( s.strip(), 'PATH', self.log )
-                self.pstrings.add( str_elt )
+            self.pstrings = { String.shared( s.strip(), 'PATH', self.log ) for s in path_strings }
 
         return self.pstrings
 
@@ -1326,6 +1450,14 @@ class Library( Element ):
     This is MEANT to have NO CHILDREN.
     """
     TypeKey = 'LIBRARY'
+    # weak references let the shared() pool drop Libraries no Executable holds any more.
+    __slots__ = ( '__weakref__', )
+
+    # libname -> the Library instance every Executable that needs it shares.
+    _pool = weakref.WeakValueDictionary()
+
+    # node_label_color = colors.blue_colors['dark']
+    VertexProto = Element.make_vertex_proto( TypeKey, node_fill_color=_FILL_LIBRARY, node_shape='ROUND_RECTANGLE' )
 
     @staticmethod
     def vertex_attrs( node_label ):
@@ -1335,15 +1467,7 @@ class Library( Element ):
         Returns:
             the attribute dictionary.
         """
-        # sets subgraph, node_label, node_label_width, node_height, node_width
-        attrs = Element.get_default_vertex_attrs( Library.TypeKey, node_label )
-
-        # set the specifics for node_label_color, node_fill_color, node_shape
-        # attrs['node_label_color'] = colors.blue_colors['dark']
-        attrs['node_fill_color']  = colors.element_fill_colors[Library.TypeKey]
-        attrs['node_shape']       = 'ROUND_RECTANGLE'
-
-        return attrs
+        return Element.fill_vertex_attrs( Library.VertexProto, node_label )
 
     def edge_attrs( edge_label ):
         """Get the attribute dictionary to use in cytoscape for this Alias edge.
@@ -1356,7 +1480,7 @@ class Library( Element ):
 
         # set the specifics for edge_label_color, edge_line_type, edge_color
         attrs['edge_line_type']     = 'SOLID'
-        attrs['edge_color']         = colors.dark_colors['blue']
+        attrs['edge_color']         = _DARK_BLUE
 
         return attrs
 
@@ -1367,7 +1491,23 @@ class Library( Element ):
             A Library instance.
         """
         super().__init__( libname, dict(), log )
-        self._key = ( libname, Library.TypeKey )
+        self._set_key( libname, Library.TypeKey, shared=True )
+
+    @classmethod
+    def shared( cls, libname, log ):
+        """Return the Library instance for libname, constructing it only if no live instance exists.
+
+        Args:
+            libname: the name of the dynamic library.
+            log: message logger; only used if a new instance is constructed.
+
+        Returns:
+            A Library instance.
+        """
+        lib = cls._pool.get( libname )
+        if lib is None:
+            lib = cls._pool[ libname ] = cls( libname, log )
+        return lib
 
     def get_vertex_attrs( self ):
         """Return a dictionary containing the Library Cytoscape vertex attributes
@@ -1388,14 +1528,6 @@ class Library( Element ):
         """
         return Library.edge_attrs( edge_label )
 
-    def add_to_graph( self, G ):
-        """Add this Element instance to graph G
-
-        Args:
-            G: the graph to add this Element to.
-        """
-        G.add_node( repr(self), **Library.vertex_attrs( self.id() ) )
-
     def make_graph_edges( self, G ):
         """These are leafs, no children"""
         pass
@@ -1406,6 +1538,13 @@ class String( Element ):
     This is MEANT to have NO CHILDREN.
     """
     TypeKey = 'STRING'
+    __slots__ = ( '__weakref__', )
+
+    # ( string, category ) -> the String instance every Executable that contains it shares.
+    _pool = weakref.WeakValueDictionary()
+
+    # node_label_color = colors.dark_colors['purple']
+    VertexProto = Element.make_vertex_proto( TypeKey, node_fill_color=_FILL_STRING, node_shape='ROUND_RECTANGLE' )
 
     @staticmethod
     def vertex_attrs( node_label ):
@@ -1415,15 +1554,7 @@ class String( Element ):
         Returns:
             the attribute dictionary.
         """
-        # sets subgraph, node_label, node_label_width, node_height, node_width
-        attrs = Element.get_default_vertex_attrs( String.TypeKey, node_label )
-
-        # set the specifics for node_label_color, node_fill_color, node_shape
-        # attrs['node_label_color'] = colors.dark_colors['purple']
-        attrs['node_fill_color']  = colors.element_fill_colors[String.TypeKey]
-        attrs['node_shape']       = 'ROUND_RECTANGLE'
-
-        return attrs
+        return Element.fill_vertex_attrs( String.VertexProto, node_label )
 
     @staticmethod
     def edge_attrs( edge_label ):
@@ -1437,7 +1568,7 @@ class String( Element ):
 
         # set the specifics for edge_label_color, edge_line_type, edge_color
         attrs['edge_line_type']     = 'SOLID'
-        attrs['edge_color']         = colors.purple_colors['dark']
+        attrs['edge_color']         = _DARK_PURPLE
 
         return attrs
 
@@ -1448,7 +1579,25 @@ class String( Element ):
             A String instance.
         """
         super().__init__( string, dict(), log )
-        self._key = ( string, "{}.{}".format(String.TypeKey,category) )
+        self._set_key( string, intern( f"{String.TypeKey}.{category}" ), shared=True )
+
+    @classmethod
+    def shared( cls, string, category, log ):
+        """Return the String instance for ( string, category ), constructing it only if no live instance exists.
+
+        Args:
+            string: the string extracted from the executable.
+            category: the kind of string, e.g., FILE or PATH.
+            log: message logger; only used if a new instance is constructed.
+
+        Returns:
+            A String instance.
+        """
+        key = ( string, category )
+        elt = cls._pool.get( key )
+        if elt is None:
+            elt = cls._pool[ key ] = cls( string, category, log )
+        return elt
 
     def get_vertex_attrs( self ):
         """Return a dictionary containing the String Cytoscape vertex attributes
@@ -1469,14 +1618,6 @@ class String( Element ):
         """
         return String.edge_attrs( edge_label )
 
-    def add_to_graph( self, G ):
-        """Add this Element instance to graph G
-
-        Args:
-            G: the graph to add this Element to.
-        """
-        G.add_node( repr(self), **String.vertex_attrs( self.id() ) )
-
     def make_graph_edges( self, G ):
         """These are leafs, no children"""
         pass
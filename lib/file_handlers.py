@@ -33,30 +33,44 @@ from json.decoder   import JSONDecodeError
 from pathlib        import Path
 from sys            import exit
 
+try:
+    # optional, used only when asked for (see create_output_file); a C encoder that is much faster than
+    # json.dump with a custom encoder class for large structs, but it writes a different layout.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class MyEncoder(JSONEncoder):
     """Convert collection types into JSON compatible types.
     
     Allows us to send arbitrary data structures to json.dump and json.dumps and get reasonable
-    output. This will detect SETS and convert then to LISTS that json knows how to output.
+    output. This will detect SETS (and FROZENSETS) and convert then to LISTS that json knows how to output.
     NOTE: Here we are IGNORING several of the critical objects. If custom encoders are needed
     place them here.
     """
     def default(self, obj):
-        if isinstance(obj, set):
+        if isinstance(obj, (set, frozenset)):
             return list(obj)
         if isinstance(obj, tuple):
             return list(obj)
         return JSONEncoder.default(self, obj)
 
 
+def _orjson_default(obj):
+    """Convert the collection types orjson does not handle natively; the orjson counterpart of MyEncoder."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
 def load_input_file(file_path: str, log: logging) -> dict:
     """Return a dictionary saved in the specified file if it is valid."""
     try:
         with open(file_path) as user_file:
             loaded_struct = load(user_file)
             log.info( f'Successfully de-serialized file: {file_path}' )
-            log.vdebug( f'Data extracted:\n\n{loaded_struct}' )
+            log.vdebug( 'Data extracted:\n\n%s', loaded_struct )
             return loaded_struct
         
     except FileNotFoundError as e:
@@ -75,7 +89,7 @@ def load_input_file(file_path: str, log: logging) -> dict:
         exit(1)
 
 
-def create_output_file(file_struct: dict, struct_type: str, output_file: str, overwrite: bool, log: logging) -> None:
+def create_output_file(file_struct: dict, struct_type: str, output_file: str, overwrite: bool, log: logging, fast_json: bool = False) -> None:
     """Write dictionary output to a file.
     
     The print_output() function will either send the final master_struct to a file or stdout
@@ -84,6 +98,10 @@ def create_output_file(file_struct: dict, struct_type: str, output_file: str, ov
     indicating no data was found.  If there is something in the specified dict, the function will
     either print the data to stdout or check to see if the filename specified is already a file.
     If the file already exists then no file will be written to avoid accidently overwriting files.
+
+    By default the file is written by json.dump with 4 space indentation, so the same struct always gives the
+    same file. With fast_json, orjson is used when it is installed; it is much faster on large structs but
+    writes 2 space indentation and unescaped UTF-8.
     """
     if file_struct != {}:
 
@@ -102,10 +120,36 @@ def create_output_file(file_struct: dict, struct_type: str, output_file: str, ov
             log.info('FAIL')
             return
        
+        if fast_json and orjson is None:
+            log.warning( 'orjson is not installed; writing the output with the json module instead.' )
+
+        out_path = Path( f'{output_file}_{struct_type}.json' )
+        opened = False
         try:
-            dump( file_struct, open( f'{output_file}_{struct_type}.json', 'w' ), indent=4, cls=MyEncoder )
+            if fast_json and orjson is not None:
+                # serialize before opening, so an unserializable struct does not leave an empty file behind.
+                # orjson only supports two space indentation.
+                data = orjson.dumps( file_struct, option=orjson.OPT_INDENT_2, default=_orjson_default )
+                opened = True
+                with open( out_path, 'wb' ) as out_file:
+                    out_file.write( data )
+            else:
+                # json.dump writes one small chunk per token, so give it a large buffer to cut the write calls.
+                opened = True
+                with open( out_path, 'w', buffering=1 << 20 ) as out_file:
+                    dump( file_struct, out_file, indent=4, cls=MyEncoder )
             log.info('SUCCESS')
 
+        except TypeError as e:
+            # unserializable values or keys; orjson's JSONEncodeError is a TypeError. json.dump may have written
+            # part of the file already, so remove it rather than leave a truncated file.
+            log.warning( f'{e}\n' )
+            log.warning( f'Could not serialize {struct_type} to JSON.' )
+            if opened:
+                out_path.unlink( missing_ok=True )
+            log.info('FAIL')
+            return
+
         except FileNotFoundError as e:
             log.warning( f'{e}\n' )
             log.warning('Specified directory was not found.  Verify the path you are trying to write to.')
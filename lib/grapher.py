@@ -26,10 +26,10 @@ Description:  This is the main logic for the tool that creates the cytoscape gra
     in the master struct.  For more information see doc strings.
 """
 
-from collections import defaultdict
+import logging
 
 from lib.element import ElementFactory, Element, Unit, Alias, Command, Executable, Library, String
-from lib.unit_file_lists import ms_only_keys
+from lib.unit_file_lists import ms_only_key_set
 
 
 
@@ -44,11 +44,15 @@ class Grapher:
     There are more direct ways than the outline above; however, this provides us with a well-formed networkx
     graph, a pandas dataframe, and the ability to visualize it in Cytoscape.
     """
-    # source and target are explicit
-    EdgeFields = { 'interaction', 'subgraph', 'directed', 'edge_label_color', 'edge_line_type', 'source_arrow_shape', 'target_arrow_shape', 'edge_color' }
+    # source and target are explicit; tuples so the dataframe columns come out in a fixed order.
+    EdgeFields = ( 'interaction', 'subgraph', 'directed', 'edge_label_color', 'edge_line_type', 'source_arrow_shape', 'target_arrow_shape', 'edge_color' )
 
     # id is explicit
-    VertexFields = { 'subgraph', 'node_label', 'node_label_color', 'node_label_width', 'node_fill_color', 'node_shape', 'node_height', 'node_width' }
+    VertexFields = ( 'subgraph', 'node_label', 'node_label_color', 'node_label_width', 'node_fill_color', 'node_shape', 'node_height', 'node_width' )
+
+    # the bool and float fields; pandas has to infer these column types. The rest hold strings and are given to
+    # pandas as object arrays, which it converts without a type inference pass over lists.
+    TypedFields = frozenset( ( 'directed', 'node_label_width', 'node_height', 'node_width' ) )
 
     def __init__( self, system_name, log ):
         self.log = log
@@ -56,6 +60,12 @@ class Grapher:
         self.emap = dict()
         self.dset = set()
         self.G = None
+        # names of the networks in Cytoscape; fetched once, see get_network_name.
+        self._network_names = None
+        # the ElementFactory and the Element lists it made; see build's reuse_elements.
+        self._efactory = None
+        self._elem_cache = dict()
+        self._elem_source = None
 
         self.init_grapher()
 
@@ -68,62 +78,87 @@ class Grapher:
         of those machines to install additional software.
         """
         global nx
+        global np
         global p4c
         global pd
 
         import networkx as nx
+        import numpy as np                      # installed with pandas.
         import py4cytoscape as p4c
         import pandas as pd                     # pandas dataframe for python cytoscape.
         
         return
 
+    def clear_element_cache( self ):
+        """Forget the Element instances made by earlier builds.
+
+        build only reuses them when called with reuse_elements for the master structure object they were made
+        from; call this when that object was changed in place. This also clears the Commands the ElementFactory
+        shares between unit files.
+        """
+        self._elem_cache = dict()
+        self._elem_source = None
+        if self._efactory is not None:
+            self._efactory.clear_command_cache()
+
 
     @staticmethod
     def make_edge_dataframe( G ):
-        # pandas dataframe uses a dictionary of lists.
-        edata = defaultdict(list)
         # for each edge
-        for s, t, data in G.edges( data=True ):
-            edata['source'].append( s )
-            edata['target'].append( t )
-            for field in Grapher.EdgeFields:
-                if field in data:
-                    edata[ field ].append( data[field] )
-                else:
-                    # must be here to meet the balanced dataframe requirement
-                    edata[ field ].append( None )
-
-        return pd.DataFrame( data = edata, columns = edata.keys() )
+        if G.is_multigraph():
+            # walk networkx's raw adjacency dicts { s: { t: { key: data } } } instead of building an edge view.
+            edges = [ ( s, t, data ) for s, nbrs in G._adj.items() for t, keydict in nbrs.items() for data in keydict.values() ]
+        else:
+            edges = list( G.edges( data=True ) )
+
+        # pandas dataframe uses a dictionary of lists; build it a column at a time.
+        # missing fields are None to meet the balanced dataframe requirement.
+        n = len( edges )
+        edata = { 'source': np.fromiter( ( e[0] for e in edges ), dtype=object, count=n ),
+                  'target': np.fromiter( ( e[1] for e in edges ), dtype=object, count=n ) }
+        datas = [ e[2] for e in edges ]
+        for field in Grapher.EdgeFields:
+            if field in Grapher.TypedFields:
+                edata[ field ] = [ data.get( field ) for data in datas ]
+            else:
+                edata[ field ] = np.fromiter( ( data.get( field ) for data in datas ), dtype=object, count=n )
+
+        return pd.DataFrame( data = edata, copy = False )
 
     @staticmethod
     def make_vertex_dataframe( G ):
-        # pandas dataframe uses a dictionary of lists.
-        vdata = defaultdict(list)
-        # for each edge
-        for v, data in G.nodes( data=True ):
-            vdata['id'].append( v )
-            for field in Grapher.VertexFields:
-                if field in data:
-                    vdata[ field ].append( data[field] )
-                else:
-                    # must be here to meet the balanced dataframe requirement
-                    vdata[ field ].append( None )
-
-        return pd.DataFrame( data = vdata, columns = vdata.keys() )
+        # for each vertex
+        vertices = list( G.nodes( data=True ) )
+
+        # pandas dataframe uses a dictionary of lists; build it a column at a time.
+        # missing fields are None to meet the balanced dataframe requirement.
+        n = len( vertices )
+        vdata = { 'id': np.fromiter( ( v[0] for v in vertices ), dtype=object, count=n ) }
+        datas = [ v[1] for v in vertices ]
+        for field in Grapher.VertexFields:
+            if field in Grapher.TypedFields:
+                vdata[ field ] = [ data.get( field ) for data in datas ]
+            else:
+                vdata[ field ] = np.fromiter( ( data.get( field ) for data in datas ), dtype=object, count=n )
+
+        return pd.DataFrame( data = vdata, copy = False )
 
     def get_network_name( self ):
         """Uses only py4cytoscape"""
         # this still works and produces a list of all the network names in cytoscape.
         self.log.debug("Getting network name...")
-        network_list = p4c.networks.get_network_list()
+        if self._network_names is None:
+            # only ask Cytoscape once; networks this Grapher creates are added as they are sent.
+            self._network_names = set( p4c.networks.get_network_list() )
+        network_names = self._network_names
         nname = self.system_name
         i = 1
         # make names until you get something unique
-        while ( nname in network_list ):
+        while ( nname in network_names ):
             nname = "{}.{}".format( self.system_name, i )
             i += 1
         self.system_name = nname
-        self.log.debug("Finished getting network name: {}".format(self.system_name))
+        self.log.debug( "Finished getting network name: %s", self.system_name )
         return self.system_name
 
     def create_cytoscape_graph( self, master_struct, force = False ):
@@ -141,6 +176,7 @@ class Grapher:
 
         gname = self.get_network_name()
         p4c.networks.create_network_from_data_frames( vdf, edf, title=gname )
+        self._network_names.add( gname )
         return self.G
 
     def transmit_to_cytoscape( self, G ):
@@ -150,6 +186,7 @@ class Grapher:
         vdf = Grapher.make_vertex_dataframe( G )
         gname = self.get_network_name()
         p4c.networks.create_network_from_data_frames( nodes=vdf, edges=edf, title=gname )
+        self._network_names.add( gname )
         self.log.debug("Finished transmitting graph data to cytoscape...")
 
     def multigraph_dump( self, G ):
@@ -163,7 +200,7 @@ class Grapher:
         for uid, adj_udict in G.adj.items():
             print("vertex: {}".format( uid ))
             for vk, vv in G.nodes[ uid ].items():
-                self.log.vdebug("\tv att: {} : {}".format( vk, vv ))
+                self.log.vdebug( "\tv att: %s : %s", vk, vv )
 
             print("\tAdjacency Information")
 
@@ -205,45 +242,53 @@ class Grapher:
         if root_string not in G:
             raise Exception( "Root: {} for tree is not in the systemd graph".format( root_string ))
 
-        # The tree created here has the "skeleton" of what we need. It is incomplete because we are working
-        # from a MultiDiGraph. In the graph we would like to derive from this tree there could be multiple
-        # edges where this tree only has one. Also NetworkX DOES NOT transfer all the attributes we
-        # have decorated our G with already; those need to be transfered.
-
-        if depth > 0:
-            T = nx.dfs_tree( G, source=str( root_string ), depth_limit=depth )
-        else:
-            # this will automagically search to the maximum depth it can.
-            T = nx.dfs_tree( G, source=str( root_string ) )
+        # This is the same depth first search nx.dfs_tree performs (a tree edge is recorded the first time a
+        # vertex is reached), but it copies the vertex attributes and ALL the parallel edges (with their
+        # attributes) from G into the tree as it goes instead of re-walking a skeleton tree afterwards.
+        # Our output tree may have multiple edges between vertices, so it is another MultiDiGraph.
+        # depth <= 0 searches to the maximum depth it can.
+        depth_limit = depth if depth > 0 else len( G )
 
-        # T now has all the vertices and edges we want WITHOUT THE ATTRIBUTES and the possible extra edges.
-        # G has all the attributes but doesn't know which ( V, E ) are in T.
-        # Also, our output tree may have multiple edges between nodes, so we need another
-        # MultiDiGraph
+        G_adj = G._adj
+        G_node = G._node
 
         Gp = nx.MultiDiGraph()
-        for v in T:
-            # T is a subgraph of G, so v can be assumed to be in G.
-            Gp.add_node( v, **G.nodes[v] )
+        Gp.add_node( root_string, **G_node[ root_string ] )
+
+        visited = { root_string }
+        stack = [ ( root_string, depth_limit, iter( G_adj[ root_string ].items() ) ) ]
+        while stack:
+            s, remaining, successors = stack[-1]
+            for t, edge_key_dict in successors:
+                if t not in visited:
+                    break
+            else:
+                stack.pop()
+                continue
 
-        for s, t in T.edges():
-            # T is a subgraph of G, so s, t can be assumed to be in G.
+            visited.add( t )
+            Gp.add_node( t, **G_node[ t ] )
             # We are transferring information from a MultiGraph, so we need to look at each possible
-            # edge AND each of those edges may have a unique set of attributes. This loop transfers
-            # those.
-            for multi_edge_id, edge_atts in G.adj[s][t].items():
+            # edge AND each of those edges may have a unique set of attributes.
+            for multi_edge_id, edge_atts in edge_key_dict.items():
                 Gp.add_edge( s, t, **edge_atts )
-        
+
+            if remaining > 1:
+                stack.append( ( t, remaining - 1, iter( G_adj[ t ].items() ) ) )
+
         self.log.debug("Finished subtree build...")
         return Gp
 
-    def build( self, master_struct : dict, rebuild_graph = False ):
+    def build( self, master_struct : dict, rebuild_graph = False, reuse_elements = False ):
         """From a master file generated from the systemd_mapper tool (it is json), construct a new dictionary
         that we can use to construct an annotated graph.
 
         Args:
             master_struct: the data file with Systemd objects to use to build the graph.
             rebuild_graph: when True any existing graph will be replaced after rebuilding it.
+            reuse_elements: when True, reuse the Element instances made by the previous build if it used this same
+                master_struct object; the caller guarantees the structure has not changed since. Otherwise every
+                Element is made again.
 
         Returns:
             returned map: key -> xxx
@@ -257,40 +302,52 @@ class Grapher:
             return self.G
 
         self.G = nx.MultiDiGraph( name = 'systemd_graph' )
+        G = self.G
 
         # get this here, in case it is NOT the first item in the dictionary; we need it for 
         # certain elements. CAUTION: this path does NOT CURRENTLY end in /
         remote_path = master_struct['remote_path']
 
-        efactory = ElementFactory( remote_path, self.log )
-
-        for uid, data in master_struct.items():
-            if uid in ms_only_keys:
-                # this is a special object in the mapping that cannot be converted into an Element instance; skip it.
-                continue
-
-            if data['metadata']['file_type'] == 'dep_dir':
-                # the dependency directory objects are not used because the SPECIFIC edge information is in the other
-                # objects in the master structure.
-                continue
-
+        if ( not reuse_elements or self._elem_source is not master_struct
+             or self._efactory is None or self._efactory.remote_path != remote_path ):
+            self.clear_element_cache()
+            self._efactory = ElementFactory( remote_path, self.log )
+            self._elem_source = master_struct
+        make_element = self._efactory.make_element
+        elem_cache = self._elem_cache
+        # the per-element messages are only formatted (and the troubleshooting lookup done) when they will be logged.
+        debug = self.log.isEnabledFor( logging.DEBUG )
+
+        # The special objects in the mapping cannot be converted into Element instances, and the dependency directory
+        # objects are not used because the SPECIFIC edge information is in the other objects in the master structure.
+        units = ( ( uid, data ) for uid, data in master_struct.items()
+                  if uid not in ms_only_key_set and data['metadata']['file_type'] != 'dep_dir' )
+
+        for uid, data in units:
             # The remaining objects in the master structure may produce a collection of Element instances we want to
             # add to the graph as vertices. 
-            for e in efactory.make_element( uid, data, master_struct ):
-                self.log.debug( "made element: {}".format( e.key() ))
-                
-                if repr(e) in self.G:
-                    # This is troubleshooting code.
-                    self.log.debug("The vertex: {} is already in the graph.".format( e.key() ))
-
-                # Objects may produce vertices that have ALREADY BEEN ADDED to the
-                # graph (see warnings above), that is fine: NetworkX will just update the attributes as needed.
-                e.add_to_graph( self.G )
-
-                # Each Element instance knows how to add edges to the graph; these are its children.
-                # Vertices may be added here as well and their attributes later updated above.
-
-                e.make_graph_edges( self.G )
+            key = ( uid, data['metadata']['file_type'] )
+            elements = elem_cache.get( key )
+            if elements is None:
+                elements = elem_cache[ key ] = make_element( uid, data, master_struct )
+            if debug:
+                for e in elements:
+                    self.log.debug( "made element: %s", e.key() )
+
+                    if repr(e) in G:
+                        # This is troubleshooting code.
+                        self.log.debug( "The vertex: %s is already in the graph.", e.key() )
+
+            # Objects may produce vertices that have ALREADY BEEN ADDED to the
+            # graph (see warnings above), that is fine: NetworkX will just update the attributes as needed.
+            G.add_nodes_from( e.graph_vertex() for e in elements )
+
+            # Each Element instance knows how to add edges to the graph; these are its children.
+            # Vertices may be added here as well and their attributes later updated above.
+            # CAUTION: edges are added one Element at a time because make_graph_edges checks the graph for the
+            # vertices and edges made before it.
+            for e in elements:
+                e.make_graph_edges( G )
 
         self.log.debug("Finished building graph...")
         return self.G
@@ -27,7 +27,10 @@ or the README.md.
 import logging
 
 from pathlib import Path
-from os import chdir
+from os import lstat, readlink, scandir
+from os.path import dirname, isdir, join, realpath
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+from sys import intern
 from typing import Any, Dict, List, Union
 
 from lib import unit_file_lists
@@ -100,17 +103,24 @@ class SystemdFileFactory:
 
 	def parse_file(self, unit_path: str, unit_name: str) -> Dict[str, Any]:
 		"""Evaluate file type and parse accordingly."""
-		self.unit_file_fp = Path( f'{self.remote_path}{unit_path}{unit_name}' )
+		# a plain string; only the file type is needed here, so no Path object.
+		self.unit_file_fp = f'{self.remote_path}{unit_path}{unit_name}'
 		self.unit_path = unit_path
 		self.name = unit_name
 
-		if self.unit_file_fp.is_dir():
+		# one lstat answers all the type checks; only a link needs another stat, to see if it points to a directory.
+		try:
+			mode = lstat( self.unit_file_fp ).st_mode
+		except OSError:
+			mode = 0
+
+		if S_ISDIR(mode) or ( S_ISLNK(mode) and isdir(self.unit_file_fp) ):
 			self.dep_dir = self.parse_dep_dir(self.unit_path)
 			return self.dep_dir.record()
-		elif self.unit_file_fp.is_symlink():
+		elif S_ISLNK(mode):
 			self.sym_link = self.parse_sym_link(self.unit_path)
 			return self.sym_link.record()
-		elif self.unit_file_fp.is_file():
+		elif S_ISREG(mode):
 			self.unit_file = self.parse_unit_file(self.unit_path)
 			return self.unit_file.record()
 		else:
@@ -178,24 +188,27 @@ class DepDir:
 		Can be one of .d, .wants, or .requires directories. After validation, record the
 		dependencies.
 		"""
-		self.dep_type: str = dep_dir.split('.')[-1]
-
-		if self.dep_type == 'd':
-			self.update_dep_dir(remote_path, path, dep_dir)
-			self.update_config_files(self.dir_items)
-		elif self.dep_type == 'wants':
-			self.update_dep_dir(remote_path, path, dep_dir)
-			self.update_wants_deps(self.dir_items)
-		elif self.dep_type == 'requires':
-			self.update_dep_dir(remote_path, path, dep_dir)
-			self.update_requires_deps(self.dir_items)
-		else:
-			logging.warning( f'Unknown or invalid folder type: "{self.dep_type}" for {remote_path}{path}{dep_dir}' )		
+		self.dep_type: str = dep_dir.rpartition('.')[2]
+
+		update_lists = self._dir_item_updaters.get(self.dep_type)
+		if update_lists is None:
+			logging.warning( f'Unknown or invalid folder type: "{self.dep_type}" for {remote_path}{path}{dep_dir}' )
+			return
+
+		self.update_dep_dir(remote_path, path, dep_dir)
+		update_lists(self, self.dir_items)
 
 	def update_dep_dir(self, remote_path: str, path: str, dep_dir: str) -> None:
 		"""Add the dir path to the dep_dir_paths list and get all file contents from the dep dir."""
 		self.dep_dir_paths.append( f'{path}{dep_dir}' )
-		self.dir_items: List[str] = [ str(dep).split('/')[-1] for dep in Path( f'{remote_path}{path}{dep_dir}' ).glob('*') ]
+		try:
+			# the directory entries already carry their base names; no Path objects needed. The same unit names
+			# show up in many dependency directories, so every record shares one copy of each.
+			with scandir( f'{remote_path}{path}{dep_dir}' ) as dir_entries:
+				self.dir_items: List[str] = [ intern(entry.name) for entry in dir_entries ]
+		except OSError:
+			# missing or unreadable directories have no items, as with Path.glob().
+			self.dir_items = []
 
 	def update_config_files(self, dir_items: List[str]) -> None:
 		"""Add all items from the dir into the config_files list"""
@@ -219,6 +232,13 @@ class DepDir:
 		self.requires_deps.extend(dir_items)
 		self.all_deps.extend(dir_items)
 
+	# the update method for each dependency directory suffix; check_dep_dir dispatches on this.
+	_dir_item_updaters = {
+		'd':        update_config_files,
+		'wants':    update_wants_deps,
+		'requires': update_requires_deps
+		}
+
 	def record(self) -> Dict[str, List[str]]:
 		"""Return a dictionary of metadata describing a Systemd dependency directory."""
 		dep_dir_data = {
@@ -227,7 +247,7 @@ class DepDir:
 			'dependencies': self.all_deps
 			}
 
-		logging.vdebug( f'Initial dependency directory structure created:\n{dep_dir_data}' )
+		logging.vdebug( 'Initial dependency directory structure created:\n%s', dep_dir_data )
 
 		if len(self.config_files) > 0:
 			dep_dir_data['config_files'] = self.config_files
@@ -256,35 +276,31 @@ class SymLink:
 		sl_full_path = f'{remote_path}{path}{unit_name}'
 		self.remote_path = remote_path
 
-		if Path(sl_full_path).is_symlink():
+		# readlink fails for anything that is not a symlink, so it is also the is_symlink check.
+		try:
+			link_target = Path( readlink(sl_full_path) )
+		except OSError:
+			logging.warning( f'{sl_full_path} is not a sym link but is being parsed as one.' )
+		else:
 			self.name = unit_name
 			self.path = path
 
-			self.target_unit: str = str( Path(sl_full_path).readlink() ).split('/')[-1]
-			self.target_path: str = self.get_target_path(sl_full_path)
-
-		else:
-			logging.warning( f'{sl_full_path} is not a sym link but is being parsed as one.' )
+			self.target_unit: str = str(link_target).rpartition('/')[2]
+			self.target_path: str = self.get_target_path(sl_full_path, link_target)
 
-	def get_target_path(self, sl_full_path: str) -> str:
+	def get_target_path(self, sl_full_path: str, sl_target_path: Path) -> str:
 		"""Return the absolute path that a unit file symbolic link points to.
 		
 		Checks to see if the target that the symbolic link is pointing to is specified through absolute 
 		or relative pathing, and converts it to an absolute path. The resulting path will be specified as 
 		the system path the sym link WOULD resolve to if the system were booting up, and the remote path 
-		will be dropped if it is present.
+		will be dropped if it is present. sl_target_path is what the link contains, as read by the constructor.
 		"""
-		sl_target_path = Path( sl_full_path ).readlink()
-
-		# Path.absolute() is wonky if we aren't in the same dir as the symlink
+		# Resolve the target's directory relative to the symlink's directory without changing the working directory,
+		# so this stays safe for other code running in the process.
 		if not sl_target_path.is_absolute():
-			current_dir = Path.cwd()
-			chdir( Path(sl_full_path).parent )
-			# Only try to chdir if symlink is pointing to a file in another dir
-			if len( str(sl_target_path).split('/') ) > 1:
-				chdir( sl_target_path.parent )
-			sl_target_path = Path.cwd()
-			chdir(current_dir)
+			target_dir = realpath( join( dirname(sl_full_path), dirname(sl_target_path) ) )
+			sl_target_path = Path(target_dir) / sl_target_path.name
 	
 		if self.remote_path != '' and self.remote_path in str(sl_target_path):
 			sl_target_path = str(sl_target_path.parent).split(self.remote_path)[-1]
@@ -322,6 +338,8 @@ class UnitFile:
 		"""
 		self.name = unit_file
 		self.path = path
+		# the name up to its FIRST '.', used to name the units implied by this one.
+		self.stem = unit_file.partition('.')[0]
 		self.unit_type = self.get_unit_type(self.name)
 		self.unit_struct: Dict[str, List[str]] = { 'metadata': { 'file_type': 'unit_file'} }
 
@@ -333,9 +351,10 @@ class UnitFile:
 		we are aware of all unit file types being recorded. If there are any unknown unit file
 		extensions or unit file types being used we should investigate them.
 		"""
-		if unit_name.split('.')[-1] in unit_file_lists.possible_unit_opts:
+		suffix = unit_name.rpartition('.')[2]
+		if suffix in unit_file_lists.possible_unit_opts:
 			logging.debug( f'"{unit_name}" is a valid unit file type' )
-			return unit_name.split('.')[-1]
+			return suffix
 		else:
 			logging.warning( f'"{self.path}{unit_name}" is an invalid or unknown unit file type, returning "target" as the type instead' )
 			return 'target'
@@ -348,36 +367,54 @@ class UnitFile:
 		associated arguments to make sure they are valid before recording.
 		"""
 		try:
-			with open( f'{remote_path}{path}{unit_file}', 'r' ) as in_file:
-				for line in in_file:
-
-					if '=' in line and '#' != line[0]:
-
-						""" Some unit files have newline escapes '\\' for exec start opts.  This combines them
-							until no more newline escapes '\\' are encountered at the end of the command/line.
-							Otherwise, the newlines won't be recorded as arguments for that option and we will 
-							lose part of the commands. """
-						
-						if line[-2] == '\\':
-							extra_line_marker = True
-							while extra_line_marker == True:
-								line = line.rstrip('\\\n') + in_file.readline()
-								if line[-2] != '\\':
-									extra_line_marker = False
-
-						line_option = line.rstrip('\n').split('=')[0]
-						arguments = '='.join( line.rstrip('\n').split('=')[1:] )
-
-						self.option = self.check_option(line_option)
-						self.arguments = self.format_arguments(line_option, arguments)
-
-						if self.option in self.unit_struct:
-							self.unit_struct[self.option].extend(self.arguments)
-						else:
-							self.unit_struct.update({ self.option: self.arguments })
-		
+			# read the whole file with one unbuffered call and parse the lines after it is closed.
+			with open( f'{remote_path}{path}{unit_file}', 'rb', buffering=0 ) as in_file:
+				raw = in_file.read()
 		except PermissionError as e:
 			logging.warning( e )
+			return
+
+		# Split into the lines text mode readlines() gives: universal newlines, each line keeping its '\n'.
+		text = raw.decode('utf-8', errors='replace')
+		if '\r' in text:
+			text = text.replace('\r\n', '\n').replace('\r', '\n')
+		lines = text.split('\n')
+		last_line = lines.pop()
+		lines = [ line + '\n' for line in lines ]
+		if last_line:
+			lines.append(last_line)
+
+		line_count = len( lines )
+		next_line = 0
+		while next_line < line_count:
+			line = lines[next_line]
+			next_line += 1
+
+			if '=' in line and '#' != line[0]:
+
+				""" Some unit files have newline escapes '\\' for exec start opts.  This combines them
+					until no more newline escapes '\\' are encountered at the end of the command/line.
+					Otherwise, the newlines won't be recorded as arguments for that option and we will 
+					lose part of the commands. """
+				
+				# slices, not line[-2], so a one character line cannot raise IndexError.
+				if line[-2:-1] == '\\':
+					while True:
+						# past the end of the file this appends '' like readline() would, then stops.
+						line = line.rstrip('\\\n') + ( lines[next_line] if next_line < line_count else '' )
+						next_line += 1
+						if line[-2:-1] != '\\' or next_line > line_count:
+							break
+
+				line_option, _, arguments = line.rstrip('\n').partition('=')
+
+				self.option = self.check_option(line_option)
+				self.arguments = self.format_arguments(line_option, arguments)
+
+				if self.option in self.unit_struct:
+					self.unit_struct[self.option].extend(self.arguments)
+				else:
+					self.unit_struct.update({ self.option: self.arguments })
 
 	def check_option(self, line_option: str) -> None:
 		"""Return valid unit file options based on the unit file type.
@@ -386,9 +423,10 @@ class UnitFile:
 		are contained in the many section option lists in the unit_file_lists.py file, and may
 		need to be updated periodically.
 		"""
-		for option_list in unit_file_lists.possible_unit_opts[self.unit_type]:
-			if line_option in option_list:
-				return line_option
+		# every unit file repeats the same option names; share one copy of each as the unit_struct keys.
+		line_option = intern(line_option)
+		if line_option in unit_file_lists.possible_unit_opt_sets[self.unit_type]:
+			return line_option
 
 		logging.warning( f'"{line_option}" is not a valid option for {self.unit_type} units.  Please investigate "{line_option}" option in {self.name}' )
 		return line_option
@@ -399,8 +437,9 @@ class UnitFile:
 		Checks to see if valid options have space delimited arguments or not and records arguments
 		based on this specification.
 		"""
-		if line_option in unit_file_lists.space_delim_opts:
-			return line_arguments.split()
+		if line_option in unit_file_lists.space_delim_opt_set:
+			# these are mostly unit names repeated across many unit files; share one copy of each.
+			return [ intern(argument) for argument in line_arguments.split() ]
 
 		return [line_arguments]
 
@@ -410,46 +449,94 @@ class UnitFile:
 		Handle all implicit deps that are created based on the unit file type. Default 
 		deps are automatically placed in the unit file upon creation, implicit deps are not.
 		"""
-		# systemd.automount(5), automatic dependencies, implicit dependencies
-		if unit_type == 'automount':
-			if 'Before' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['Before'].extend( [ f'{self.name.split(".")[0]}.mount' ] )
+		# the unit type specific dependencies; see the _*_implicit_dependencies methods below.
+		add_type_dependencies = self._implicit_dependency_handlers.get(unit_type)
+		if add_type_dependencies is not None:
+			add_type_dependencies(self)
+
+		# systemd.exec(5), implicit dependencies, bullet 4
+		if 'TTYPath' in self.unit_struct:
+			if 'After' in self.unit_struct['metadata']:
+				self.unit_struct['metadata']['After'].extend( ['systemd-vconsole-setup.service'] )
 			else:
-				self.unit_struct['metadata'].update({ 'Before': [ f'{self.name.split(".")[0]}.mount' ] })
+				self.unit_struct['metadata'].update({ 'After': ['systemd-vconsole-setup.service'] })
+		
+		# systemd.exec(5), implicit dependencies, bullet 5
+		if 'LogNamespace' in self.unit_struct:
+			if 'Requires' in self.unit_struct['metadata']:
+				self.unit_struct['metadata']['Requires'].extend( [ 'systemd-journald@.service' ] )
+			else:
+				self.unit_struct['metadata'].update({ 'Requires': [ 'systemd-journald@.service' ] })
+
+		# systemd.resource-control(5), implicit dependencies, bullet 1
+		if 'Slice' in self.unit_struct:
+			if 'Requires' in self.unit_struct['metadata']:
+				self.unit_struct['metadata']['Requires'].extend( [ self.unit_struct['Slice'] ] )
+			else:
+				self.unit_struct['metadata'].update({ 'Requires': [ self.unit_struct['Slice'] ] })
+			
+			if 'After' in self.unit_struct['metadata']:
+				self.unit_struct['metadata']['After'].extend( [ self.unit_struct['Slice'] ] )
+			else:
+				self.unit_struct['metadata'].update({ 'After': [ self.unit_struct['Slice'] ] })
+
+		# Two different references here, check dictionary updates for more info.  Currently I haven't seen
+		# any unit file instances, only symlinks.  These are being recorded w/o needing this implicit dep.
+		if '@' in self.name and len( self.name.split('@')[-1].split('.')[0] ) != 0:
+			self.unit_struct['metadata'].update({
+				# systemd.unit(5), description, paragraph 17 (or -4)
+				'iTemplate': [ f'{self.name.split("@")[0]}@.{self.unit_type}' ],
+				# systemd.service(5), default dependencies, bullet 2
+				'iSlice_of': [ f'{self.name.split("@")[0]}.slice' ]
+			})
+
+	def _automount_implicit_dependencies(self) -> None:
+		"""Record the implicit dependencies of an automount unit."""
+		# systemd.automount(5), automatic dependencies, implicit dependencies
+		if 'Before' in self.unit_struct['metadata']:
+			self.unit_struct['metadata']['Before'].extend( [ f'{self.stem}.mount' ] )
+		else:
+			self.unit_struct['metadata'].update({ 'Before': [ f'{self.stem}.mount' ] })
 
+	def _path_implicit_dependencies(self) -> None:
+		"""Record the implicit dependencies of a path unit."""
 		# systemd.path(5), description, para 3
-		if unit_type == 'path' and 'Unit' not in self.unit_struct:
+		if 'Unit' not in self.unit_struct:
 			if 'iPath_for' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['iPath_for'].extend( [ f'{self.name.split(".")[0]}.service' ] )
+				self.unit_struct['metadata']['iPath_for'].extend( [ f'{self.stem}.service' ] )
 			else:
-				self.unit_struct['metadata'].update({ 'iPath_for': [ f'{self.name.split(".")[0]}.service' ] })
+				self.unit_struct['metadata'].update({ 'iPath_for': [ f'{self.stem}.service' ] })
 
 			if 'Before' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['Before'].extend( [ f'{self.name.split(".")[0]}.service' ] )
+				self.unit_struct['metadata']['Before'].extend( [ f'{self.stem}.service' ] )
 			else:
-				self.unit_struct['metadata'].update({ 'Before': [ f'{self.name.split(".")[0]}.service' ] })
+				self.unit_struct['metadata'].update({ 'Before': [ f'{self.stem}.service' ] })
 
+	def _socket_implicit_dependencies(self) -> None:
+		"""Record the implicit dependencies of a socket unit."""
 		# systemd.socket(5), description, para 4
-		if unit_type == 'socket' and 'Service' not in self.unit_struct:
+		if 'Service' not in self.unit_struct:
 			if 'iSocket_of' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['iSocket_of'].extend( [ f'{self.name.split(".")[0]}.service' ] )
+				self.unit_struct['metadata']['iSocket_of'].extend( [ f'{self.stem}.service' ] )
 			else:
-				self.unit_struct['metadata'].update({ 'iSocket_of': [ f'{self.name.split(".")[0]}.service' ] })
-
+				self.unit_struct['metadata'].update({ 'iSocket_of': [ f'{self.stem}.service' ] })
+		
 		# systemd.socket(5), automatic dependencies, implicit dependencies
-		if unit_type == 'socket' and 'BindToDevice' in self.unit_struct:
+		if 'BindToDevice' in self.unit_struct:
 			if 'BindsTo' in self.unit_struct['metadata']:
 				self.unit_struct['metadata']['BindsTo'].extend( [ f'{self.unit_struct["BindToDevice"]}' ] )
 			else:
 				self.unit_struct['metadata'].update({ 'BindsTo': [ self.unit_struct['BindToDevice'] ] })
 			
 			if 'After' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['After'].extend( [ f'{self.name.split(".")[0]}.service' ] )
+				self.unit_struct['metadata']['After'].extend( [ f'{self.stem}.service' ] )
 			else:
-				self.unit_struct['metadata'].update({ 'After': [ f'{self.name.split(".")[0]}.service' ] })
+				self.unit_struct['metadata'].update({ 'After': [ f'{self.stem}.service' ] })
 
+	def _service_implicit_dependencies(self) -> None:
+		"""Record the implicit dependencies of a service unit."""
 		# systemd.service(5), automatic dependencies, implicit dependencies, bullet 1
-		if unit_type == 'service' and 'Type' in self.unit_struct:
+		if 'Type' in self.unit_struct:
 			if self.unit_struct['Type'] == 'dbus':
 				if 'Requires' in self.unit_struct['metadata']:
 					self.unit_struct['metadata']['Requires'].extend( [ 'dbus.socket' ] )
@@ -462,9 +549,9 @@ class UnitFile:
 					self.unit_struct['metadata'].update({ 'After': [ 'dbus.socket' ] })
 		
 		# systemd.service(5), automatic dependencies, implicit dependencies, bullet 2
-		if unit_type == 'service' and 'Sockets' in self.unit_struct:
+		if 'Sockets' in self.unit_struct:
 			if isinstance(self.unit_struct['Sockets'], str):
-				socket_unit_list = [ unit for unit in self.unit_struct['Sockets'].split(' ') ]
+				socket_unit_list = self.unit_struct['Sockets'].split()
 			elif isinstance(self.unit_struct['Sockets'], list):
 				socket_unit_list = self.unit_struct['Sockets']
 			else:
@@ -480,55 +567,30 @@ class UnitFile:
 			else:
 				self.unit_struct['metadata'].update({ 'After': socket_unit_list })
 
+	def _timer_implicit_dependencies(self) -> None:
+		"""Record the implicit dependencies of a timer unit."""
 		# systemd.timer(5), description, para 3/ systemd.timer(5), implicit dependencies, bullet 1
-		if unit_type == 'timer' and 'Unit' not in self.unit_struct:
+		if 'Unit' not in self.unit_struct:
 			if 'iTimer_for' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['iTimer_for'].extend( [ f'{self.name.split(".")[0]}.service' ] )
+				self.unit_struct['metadata']['iTimer_for'].extend( [ f'{self.stem}.service' ] )
 			else:
-				self.unit_struct['metadata'].update({ 'iTimer_for': [ f'{self.name.split(".")[0]}.service' ] })
+				self.unit_struct['metadata'].update({ 'iTimer_for': [ f'{self.stem}.service' ] })
 
 			if 'Before' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['Before'].extend( [ f'{self.name.split(".")[0]}.service' ] )
+				self.unit_struct['metadata']['Before'].extend( [ f'{self.stem}.service' ] )
 			else:
-				self.unit_struct['metadata'].update({ 'Before': [ f'{self.name.split(".")[0]}.service' ] })
+				self.unit_struct['metadata'].update({ 'Before': [ f'{self.stem}.service' ] })
 
-		# systemd.exec(5), implicit dependencies, bullet 4
-		if 'TTYPath' in self.unit_struct:
-			if 'After' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['After'].extend( ['systemd-vconsole-setup.service'] )
-			else:
-				self.unit_struct['metadata'].update({ 'After': ['systemd-vconsole-setup.service'] })
-		
-		# systemd.exec(5), implicit dependencies, bullet 5
-		if 'LogNamespace' in self.unit_struct:
-			if 'Requires' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['Requires'].extend( [ 'systemd-journald@.service' ] )
-			else:
-				self.unit_struct['metadata'].update({ 'Requires': [ 'systemd-journald@.service' ] })
-
-		# systemd.resource-control(5), implicit dependencies, bullet 1
-		if 'Slice' in self.unit_struct:
-			if 'Requires' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['Requires'].extend( [ self.unit_struct['Slice'] ] )
-			else:
-				self.unit_struct['metadata'].update({ 'Requires': [ self.unit_struct['Slice'] ] })
-			
-			if 'After' in self.unit_struct['metadata']:
-				self.unit_struct['metadata']['After'].extend( [ self.unit_struct['Slice'] ] )
-			else:
-				self.unit_struct['metadata'].update({ 'After': [ self.unit_struct['Slice'] ] })
-
-		# Two different references here, check dictionary updates for more info.  Currently I haven't seen
-		# any unit file instances, only symlinks.  These are being recorded w/o needing this implicit dep.
-		if '@' in self.name and len( self.name.split('@')[-1].split('.')[0] ) != 0:
-			self.unit_struct['metadata'].update({
-				# systemd.unit(5), description, paragraph 17 (or -4)
-				'iTemplate': [ f'{self.name.split("@")[0]}@.{self.unit_type}' ],
-				# systemd.service(5), default dependencies, bullet 2
-				'iSlice_of': [ f'{self.name.split("@")[0]}.slice' ]
-			})
+	# check_implicit_dependencies dispatches on the unit type through this.
+	_implicit_dependency_handlers = {
+		'automount': _automount_implicit_dependencies,
+		'path':      _path_implicit_dependencies,
+		'socket':    _socket_implicit_dependencies,
+		'service':   _service_implicit_dependencies,
+		'timer':     _timer_implicit_dependencies
+		}
 
 	def record(self) -> Dict[str, List[str]]:
 		"""Return a dictionary of metadata describing a Systemd unit file."""
-		logging.vdebug( f'Final unit file structure being returned:\n{self.unit_struct}' )
+		logging.vdebug( 'Final unit file structure being returned:\n%s', self.unit_struct )
 		return self.unit_struct
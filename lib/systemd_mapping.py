@@ -147,8 +147,10 @@ def get_bin_strings(remote_path: str, binary: str) -> Tuple[Set, Set]:
     # one more / followed by alphanum, '.', or '-' chars any num of times
 
     output = run( [ 'strings', f'{remote_path}{binary}' ], capture_output=True, text=True )
-    files = { file.split('=')[-1] for file in filter( file_regex.match, output.stdout.split() ) }
-    strings = { string.split('=')[-1] for string in filter( path_regex.match, output.stdout.split() ) }
+    tokens = output.stdout.split()
+    # rpartition gives the text after the last '=' (or the whole token) without building a list.
+    files = { file.rpartition('=')[2] for file in filter( file_regex.match, tokens ) }
+    strings = { string.rpartition('=')[2] for string in filter( path_regex.match, tokens ) }
 
     # Since path regex will match on the same strings as file_regex, remove files from strings
     strings.symmetric_difference_update(files)
@@ -356,7 +358,7 @@ def map_systemd_full(master_struct: Dict, log: logging) -> dict:
                 master_struct.update({ f'{unit_path}{current_unit}': unit_file })
 
     log.info( f'Finished recording all Systemd unit files into Master Structure' )
-    log.vdebug( f'\n\n{master_struct}' )
+    log.vdebug( '\n\n%s', master_struct )
 
     fstab = sysd_obj_parser.parse_fstab()
 
@@ -425,7 +427,7 @@ def map_dependencies( master_struct: Dict, origin_unit: str, log: logging ) -> d
             will be created when a systemd system starts up.
     """
     log.info('Starting the dependency relationship mapping...')
-    log.vdebug( f'Searching for dependency relationships in:\n\n{master_struct}' )
+    log.vdebug( 'Searching for dependency relationships in:\n\n%s', master_struct )
 
     unrecorded_dependencies: List[tuple] = [(origin_unit, 'None', 'None')]
 
@@ -446,7 +448,7 @@ def map_dependencies( master_struct: Dict, origin_unit: str, log: logging ) -> d
                 break
 
             # skip parsing non-unit file keys
-            if sysd_obj_key in unit_file_lists.ms_only_keys:
+            if sysd_obj_key in unit_file_lists.ms_only_key_set:
                 continue
 
             # Dep dir names will trigger false positives on all units contained in the dir unless we only look
@@ -464,16 +466,18 @@ def map_dependencies( master_struct: Dict, origin_unit: str, log: logging ) -> d
 
         record_binary_metadata( new_dep_unit, master_struct, dependency_map )
         log.debug( f'info recorded for {new_dep_unit.unit_name}:' )
-        log.vdebug( f'{new_dep_unit.record()}\n' )
+        if log.isEnabledFor( logging.VDEBUG ):
+            # logging.VDEBUG is registered by init_logger; only rebuild the record when it will be logged.
+            log.vdebug( '%s\n', new_dep_unit.record() )
 
         record_dep_tups(new_dep_tups, recorded_dependencies, unrecorded_dependencies)
         recorded_dependencies.append(unrecorded_dependencies.pop(0))
-        log.vdebug( f'\nrecorded dependencies: {recorded_dependencies}' )
-        log.vdebug( f'unrecorded dependencies: {unrecorded_dependencies}' )
-        log.vdebug( f'\n\nnew dependency map: {dependency_map}\n' )
+        log.vdebug( '\nrecorded dependencies: %s', recorded_dependencies )
+        log.vdebug( 'unrecorded dependencies: %s', unrecorded_dependencies )
+        log.vdebug( '\n\nnew dependency map: %s\n', dependency_map )
 
     log.info('Finished recording all dependency relationships...')
-    log.vdebug( f'\n\n{dependency_map}' )
+    log.vdebug( '\n\n%s', dependency_map )
 
     log.info( 'Searching for fstab units that will be dynamically created during bootup...' )
     dependency_map['dynamic_mount_points'] = record_fstab_units( dependency_map, master_struct )
@@ -646,7 +650,7 @@ def record_fstab_units( dependency_map, master_struct ) -> None:
     dynamic_mount_points = {}
 
     for entry in master_struct:
-        if ( entry not in unit_file_lists.ms_only_keys and
+        if ( entry not in unit_file_lists.ms_only_key_set and
              master_struct[entry]['metadata']['file_type'] == 'fstab_unit' ):
             
             unit_name = entry.split('/')[-1]
@@ -712,13 +716,13 @@ def compare_map_files(
 
         elif tlk not in comp_file:
             diff_dict.update({ tlk: 'This key was found in the origin file but not the comparison file' })
-            log.vdebug( f'Origin file entry:\n{origin_file.keys()},\nComparison file entry:\n{comp_file.keys()}' )
+            log.vdebug( 'Origin file entry:\n%s,\nComparison file entry:\n%s', origin_file.keys(), comp_file.keys() )
             continue
 
         elif isinstance(origin_file[tlk], str):
             if origin_file[tlk] != comp_file[tlk]:
                 diff_dict.update({ tlk: f"Origin file has: '{origin_file[tlk]}', but comparison file has: '{comp_file[tlk]}'" })
-                log.vdebug( f'Origin file entry:\n{origin_file[tlk]},\nComparison file entry:\n{comp_file[tlk]}' )
+                log.vdebug( 'Origin file entry:\n%s,\nComparison file entry:\n%s', origin_file[tlk], comp_file[tlk] )
             continue
 
         for subkey in origin_file[tlk]:
@@ -733,7 +737,7 @@ def compare_map_files(
                 else:
                     diff_dict[tlk].update({ subkey: 'This subkey was found in the origin file but not the comparison file!' })
 
-                log.vdebug( f'Origin file entry:\n{origin_file[tlk]},\nComparison file entry:\n{comp_file[tlk]}' )
+                log.vdebug( 'Origin file entry:\n%s,\nComparison file entry:\n%s', origin_file[tlk], comp_file[tlk] )
                 continue
 
             # Check to see if subkey value is a dict or a list, since lists will always
@@ -757,7 +761,7 @@ def compare_map_files(
                             diff_dict[tlk].update({ subkey: { item: 'This subkey was found in the origin file but not the comparison file!' } })
                         else:
                             diff_dict[tlk][subkey].update({ item: 'This subkey was found in the origin file but not the comparison file!' })
-                            log.vdebug( f'Origin file entry:\n{origin_file[tlk][subkey]},\ncomparison file entry:\n{comp_file[tlk][subkey]}' )
+                            log.vdebug( 'Origin file entry:\n%s,\ncomparison file entry:\n%s', origin_file[tlk][subkey], comp_file[tlk][subkey] )
 
                     elif isinstance(origin_file[tlk][subkey][item], str):
                         if origin_file[tlk][subkey][item] != comp_file[tlk][subkey][item]:
@@ -792,7 +796,7 @@ def compare_map_files(
                     diff_dict.update({ tlk: { subkey: 'This subkey was found in the comparison file but not the origin file!' } })
                 else:
                     diff_dict[tlk].update({ subkey: 'This subkey was found in the comparison file but not the origin file!' })
-                log.vdebug( f'Comparison file entry:\n{comp_file[tlk]},\nOrigin file entry:\n{origin_file[tlk]}' )
+                log.vdebug( 'Comparison file entry:\n%s,\nOrigin file entry:\n%s', comp_file[tlk], origin_file[tlk] )
 
             elif isinstance(comp_file[tlk][subkey], dict):
 
@@ -808,7 +812,7 @@ def compare_map_files(
                             diff_dict[tlk].update({ subkey: { item: f'This subkey was found in the comparison file but not the origin file!' } })
                         else:
                             diff_dict[tlk][subkey].update({ item: f'This subkey was found in the comparison file but not the origin file!' })
-                        log.vdebug( f'Comparison file entry:\n{comp_file[tlk][subkey]},\nOrigin file entry:\n{origin_file[tlk][subkey]}' )
+                        log.vdebug( 'Comparison file entry:\n%s,\nOrigin file entry:\n%s', comp_file[tlk][subkey], origin_file[tlk][subkey] )
 
     # After we iterate through all of the top level keys in the origin file, we want to make sure that
     # there aren't any top level keys that were in the comparison file that weren't in the origin file
@@ -819,7 +823,7 @@ def compare_map_files(
 
         elif tlk not in origin_file:
             diff_dict.update({ tlk: 'This key was found in the comparison file but not the origin file!' })
-            log.vdebug( f'Comparison file entry:\n{comp_file.keys()},\nOrigin file entry:\n{origin_file.keys()}' )
+            log.vdebug( 'Comparison file entry:\n%s,\nOrigin file entry:\n%s', comp_file.keys(), origin_file.keys() )
 
     return diff_dict
 
@@ -863,7 +867,7 @@ def compare_lists( origin_file_list: List[str],
         if item not in origin_file_list:
             unique_to_comp.append(item)
     
-    if tlk in unit_file_lists.ms_only_keys:
+    if tlk in unit_file_lists.ms_only_key_set:
         # Discard redundant differences if they are just library updates
         for orig_lib in unique_to_origin:
             for comp_lib in unique_to_comp:
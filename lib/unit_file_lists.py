@@ -796,6 +796,12 @@ possible_unit_opts = {
     suffix, and iterate through possible_unit_opts[unit_type].
 """
 
+possible_unit_opt_sets = { unit_type: frozenset().union(*option_lists) for unit_type, option_lists in possible_unit_opts.items() }
+"""
+    possible_unit_opts with each unit type's option lists merged into one set, so checking an option is a
+    single lookup instead of a scan of every list.
+"""
+
 unit_dependency_opts = [
     'Wants',
     'Requires',
@@ -842,6 +848,11 @@ space_delim_opts = [
     options like Exec and Description aren't a list of strings when they need to be a single string.
 """
 
+space_delim_opt_set = frozenset(space_delim_opts)
+"""
+    space_delim_opts as a set for membership checks.
+"""
+
 command_directives = [
     'ExecStart',
     'ExecCondition',
@@ -867,4 +878,9 @@ ms_only_keys = [
 """
     This is a list of keys that have different formatting than the unit file entries and shouldn't be 
     parsed by the dependency map.
-"""
\ No newline at end of file
+"""
+
+ms_only_key_set = frozenset(ms_only_keys)
+"""
+    ms_only_keys as a set for membership checks.
+"""
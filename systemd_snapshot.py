@@ -143,6 +143,13 @@ systemd_snapshot.py -a diff -p snap1_ms.json -c snap2_ms.json   - compare the di
         action='store_true',
         help='Allow systemd snapshot to overwrite files if they already exist.')
 
+    parser.add_argument(
+        '--fast-json',
+        dest='fast_json',
+        action='store_true',
+        help='''Write output files with orjson if it is installed. Much faster for large snapshots, but the files use 2 space
+        indentation and unescaped UTF-8, so they differ byte for byte from the default output.''')
+
     parser.add_argument(
         '-p',
         '--path',
@@ -217,13 +224,13 @@ systemd_snapshot.py -a diff -p snap1_ms.json -c snap2_ms.json   - compare the di
     if action in ('master', 'all'):
         # if master or all is the chosen action, user_path will be passed as the remote_path
         master_struct = map_systemd_full({'remote_path': user_path}, log)
-        create_output_file(master_struct, 'ms', output_file, args.overwrite, log)
+        create_output_file(master_struct, 'ms', output_file, args.overwrite, log, args.fast_json)
 
     elif action not in ('master', 'all') and user_path == '':
         # if no path to a ms file is given, no remote_path is used which parses the locally hosted system
         log.info( f'No path given. Parsing local systemd system to build a master struct' )
         master_struct = map_systemd_full({'remote_path': user_path}, log)
-        create_output_file(master_struct, 'ms', output_file, args.overwrite, log)
+        create_output_file(master_struct, 'ms', output_file, args.overwrite, log, args.fast_json)
 
     else:
         # if a path is given w/other than master or all, load the file at the given path for future actions
@@ -231,7 +238,7 @@ systemd_snapshot.py -a diff -p snap1_ms.json -c snap2_ms.json   - compare the di
 
     if action in ('dep', 'deps', 'all'):
         dependency_map = map_dependencies(master_struct, origin_unit, log)
-        create_output_file(dependency_map, 'dm', output_file, args.overwrite, log)
+        create_output_file(dependency_map, 'dm', output_file, args.overwrite, log, args.fast_json)
 
     if action in ('graph', 'all'):
         # the user wants a graph created and transmitted via REST to Cytoscape.
@@ -291,7 +298,7 @@ systemd_snapshot.py -a diff -p snap1_ms.json -c snap2_ms.json   - compare the di
 
         # if a change has been made in either of the comparison items, record necessary changes.
         diff_dict = compare_map_files( initial_file, comp_file, log )
-        create_output_file( diff_dict, 'df', output_file, args.overwrite, log )
+        create_output_file( diff_dict, 'df', output_file, args.overwrite, log, args.fast_json )
 
 if __name__ == '__main__':
     main()
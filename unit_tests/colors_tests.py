@@ -0,0 +1,88 @@
+'''
+colors_tests.py
+Author: Michael R. Huettel
+Author: Jason M. Carter
+Date: December 2023
+Version: 1.0
+
+Licensed under the Apache License, Version 2.0 (the "License")
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contributors:
+    Oak Ridge National Laboratory
+
+Description: This is a test file that is used to test the palette lookups in lib/colors.py.
+    Numpy is required, the same as for the graphing side of the tool.
+'''
+
+import unittest
+
+from lib import colors
+
+
+class TestNearestPaletteIndex(unittest.TestCase):
+
+    def test_palette_colors_map_to_themselves(self) -> None:
+        '''Verify every palette color is its own nearest palette entry'''
+
+        palettes, _ = colors.get_palettes_rgb()
+        flat_palettes = palettes.reshape(-1, 3)
+
+        for name, palette in colors._shaded_palettes_rgb.items():
+            for shade, rgb in palette.items():
+                index = colors.nearest_palette_index(*rgb)
+                self.assertEqual(tuple(flat_palettes[index]), rgb, f'{name} {shade}')
+
+                # gray is shared by several palettes, so any of them is a correct answer
+                if shade != 'gray':
+                    self.assertEqual(divmod(index, len(colors.shade_names)),
+                                     (colors.palette_index[name], colors.shade_index[shade]))
+
+
+    def test_masked_cells_never_returned(self) -> None:
+        '''Verify no color maps to a (palette, shade) cell the palettes do not define'''
+
+        _, mask = colors.get_palettes_rgb()
+        flat_mask = mask.reshape(-1)
+
+        for r in range(4, 256, 8):
+            for g in range(4, 256, 8):
+                for b in range(4, 256, 8):
+                    self.assertTrue(flat_mask[colors.nearest_palette_index(r, g, b)], (r, g, b))
+
+
+    def test_out_of_range_channels(self) -> None:
+        '''Verify channels outside [0, 255] are rejected instead of misindexing the lookup table'''
+
+        for rgb in ((-1, 0, 0), (0, 256, 0), (0, 0, 1000)):
+            with self.assertRaises(ValueError):
+                colors.nearest_palette_index(*rgb)
+
+        colors.nearest_palette_index(0, 0, 0)
+        colors.nearest_palette_index(255, 255, 255)
+
+
+def get_color_tests() -> unittest.TestSuite:
+    '''Create a test suite to test the palette lookup functions'''
+
+    return unittest.TestLoader().loadTestsFromTestCase(TestNearestPaletteIndex)
+
+
+def main() -> None:
+    runner = unittest.TextTestRunner()
+
+    print('\nTesting palette lookup functions...')
+    runner.run(get_color_tests())
+    print('No artifacts to clean up')
+
+if __name__ == '__main__':
+    main()
@@ -28,11 +28,135 @@ Description: This is a test file that is used to test lib/dep_obj_parser.py.
 import unittest
 import logging
 
+from copy import deepcopy
 from typing import List
 
 from lib.dep_obj_parser import DepMapUnit
 
 
+# Attributes every freshly built DepMapUnit must carry
+_EXPECTED_ATTRS = frozenset({
+    'sym_linked_to', 'sym_linked_from', 'wants', 'wanted_by', 'requires', 'required_by',
+    'requisite', 'requisite_of', 'bindsto', 'bound_by', 'partof', 'has_part', 'upholds',
+    'upheld_by', 'onsuccess', 'on_success_of', 'sockets', 'socket_of', 'service',
+    'uses_service', 'parents', 'reverse_deps', 'dependencies'
+})
+
+# Dependency tuples test_create_dep_tups expects for a unit named test.target
+_EXPECTED_TUPS = frozenset({
+    ('wants.target', 'test.target', 'wanted_by'),
+    ('requires.target', 'test.target', 'required_by'),
+    ('requisite.target', 'test.target', 'requisite_of'),
+    ('bindsto.target', 'test.target', 'bound_by'),
+    ('partof.target', 'test.target', 'has_part'),
+    ('upholds.target', 'test.target', 'upheld_by'),
+    ('onsuccess.target', 'test.target', 'on_success_of'),
+    ('sockets.socket', 'test.target', 'socket_of'),
+    ('service.service', 'test.target', 'uses_service'),
+    ('timer.service', 'test.target', 'has_timer'),
+    ('socket.service', 'test.target', 'has_socket'),
+    ('path.service', 'test.target', 'needs_path')
+})
+
+# Set attributes test_dep_map_unit_record populates and expects back as lists
+_RECORDED_SET_ATTRS = ('requires', 'sockets', 'uses_service', 'service', 'wanted_by')
+
+# Master struct and dep map entries fed to the parser.  Tests pass deepcopy()s of these so
+# nothing one test does can leak into another.
+_MS_DEP_DIR_STRUCT = {
+    'metadata': {
+        'unit_file':    'test_unit.wants',
+        'Wants':        ['wants1.target', 'wants2.target'],
+        'Requires':     ['requires1.target', 'requires2.target'],
+        'd':            ['config1.cfg', 'config2.cfg'],
+        'file_type':    'dep_dir'
+    }
+}
+
+_MS_SYM_LINK_STRUCT = {
+    "metadata": {
+        "unit_file": "sym_link.target",
+        "file_type": "sym_link",
+        "sym_link_path": "/etc/systemd/system/",
+        "sym_link_unit": "sym_link.target",
+        "sym_link_target_path": "/lib/systemd/system/",
+        "sym_link_target_unit": "target.target",
+        "dependencies": [ "target.target" ]
+    }
+}
+
+_MS_UNIT_FILE_STRUCT = {
+    "metadata": { "file_type": "unit_file" },
+    "Description": [ "Some random unit file" ],
+    "PartOf": [ "enabled.target", "lxdm.target" ],
+    "Wants": [ "graphical.target" ],
+    "Before": [ "enabled.target" ],
+    "OnFailure": [ "failure.service" ],
+    "OnSuccess": [ "success.service" ],
+    "Requisite": [ "default.target" ],
+    "Requires": [ "multi-user.target" ],
+    "LimitCORE": [ "infinity" ],
+    "BindsTo": [ "multi-user.target", "graphical.target" ],
+    "LimitNOFILE": [ "infinity " ],
+    "RuntimeDirectory": [ "dir" ],
+    "RuntimeDirectoryPreserve": [ "yes" ],
+    "ExecStartPre": [ "rm -f /var/lib/bin/*.frc", "rm -f /var/lib/bin_failover/*.frc" ],
+    "ExecStart": [ "/usr/bin/bin /run/bin/bin.cfg" ],
+    "ExecStopPost": [ "/usr/bin/watchdogtickle -a" ],
+    "Upholds": [ "default.target" ],
+    "Sockets": [ "socket.socket" ],
+    "Service": [ "service.service" ],
+    "WantedBy": [ "enabled.target" ]
+}
+
+_MS_CONFIG_DIR_ENTRY = {
+    "metadata": { "file_type": "dep_dir" }
+}
+
+_MS_WANTS_DIR_ENTRY = {
+    "metadata": {
+        "file_type": "dep_dir",
+        "dependency_folder_paths": [ "/etc/systemd/system/timers.target.wants" ],
+        "Wants": [ "logrotate.timer", "hwclock-sync.timer" ]
+    }
+}
+
+_MS_REQUIRES_DIR_ENTRY = {
+    "metadata": {
+        "file_type": "dep_dir",
+        "dependency_folder_paths": [ "/etc/systemd/system/random.service.requires" ],
+        "Requires": [ "another.service" ]
+    }
+}
+
+_MS_SYM_LINK_ENTRY = {
+    "metadata": {
+        "file_type": "sym_link",
+        "sym_link_target_path": "/lib/systemd/system/",
+        "sym_link_target_unit": "rsyslog.service",
+        "dependencies": [ "rsyslog.service" ]
+    }
+}
+
+_MS_UNIT_FILE_ENTRY = {
+    "metadata": { "file_type": "unit_file" },
+    "Requires": [ "syslog.socket" ]
+}
+
+_MS_INVALID_FILE_ENTRY = {
+    "metadata": { "file_type": "invalid" }
+}
+
+_OLD_DEP_MAP_ENTRY = {
+    "unit_name": "multi-user.target",
+    "parents": [ "enabled.target" ],
+    "reverse_deps": [ "required_by" ],
+    "Wants": [ "gfarmond.service", "rngd.service", "dnsmasq.service" ],
+    "Requires": [ "basic.target" ],
+    "required_by": [ "graphical.target" ],
+    "dependencies": [ "gfarmond.service", "rngd.service", "dnsmasq.service", "basic.target" ]
+}
+
 
 class TestDepMapUnits(unittest.TestCase):
 
@@ -41,87 +165,34 @@ class TestDepMapUnits(unittest.TestCase):
 
         dep_unit = DepMapUnit('test_unit.wants', 'None', 'None')
 
-        self.assertTrue(hasattr(dep_unit, 'sym_linked_to'))
-        self.assertTrue(hasattr(dep_unit, 'sym_linked_from'))
-        self.assertTrue(hasattr(dep_unit, 'wants'))
-        self.assertTrue(hasattr(dep_unit, 'wanted_by'))
-        self.assertTrue(hasattr(dep_unit, 'requires'))
-        self.assertTrue(hasattr(dep_unit, 'required_by'))
-        self.assertTrue(hasattr(dep_unit, 'requisite'))
-        self.assertTrue(hasattr(dep_unit, 'requisite_of'))
-        self.assertTrue(hasattr(dep_unit, 'bindsto'))
-        self.assertTrue(hasattr(dep_unit, 'bound_by'))
-        self.assertTrue(hasattr(dep_unit, 'partof'))
-        self.assertTrue(hasattr(dep_unit, 'has_part'))
-        self.assertTrue(hasattr(dep_unit, 'upholds'))
-        self.assertTrue(hasattr(dep_unit, 'upheld_by'))
-        self.assertTrue(hasattr(dep_unit, 'onsuccess'))
-        self.assertTrue(hasattr(dep_unit, 'on_success_of'))
-        self.assertTrue(hasattr(dep_unit, 'sockets'))
-        self.assertTrue(hasattr(dep_unit, 'socket_of'))
-        self.assertTrue(hasattr(dep_unit, 'service'))
-        self.assertTrue(hasattr(dep_unit, 'uses_service'))
-        self.assertTrue(hasattr(dep_unit, 'parents'))
-        self.assertTrue(hasattr(dep_unit, 'reverse_deps'))
-        self.assertTrue(hasattr(dep_unit, 'dependencies'))
-        
+        for attribute in _EXPECTED_ATTRS:
+            self.assertIsInstance(getattr(dep_unit, attribute, None), set, attribute)
+        self.assertFalse(hasattr(dep_unit, '__dict__'))
+
 
     def test_update_ms_dep_dir(self) -> None:
         '''Verify the actual parsing for master struct dependency directories is correct'''
 
-        test_ms_unit_struct = {
-            'metadata': {
-                'unit_file':    'test_unit.wants',
-                'Wants':        ['wants1.target', 'wants2.target'],
-                'Requires':     ['requires1.target', 'requires2.target'],
-                'd':            ['config1.cfg', 'config2.cfg'],
-                'file_type':    'dep_dir'
-            }
-        }
-
         dep_unit = DepMapUnit('test_unit.wants', 'None', 'None')
-        dep_unit.update_ms_dep_dir(test_ms_unit_struct)
+        dep_unit.update_ms_dep_dir(deepcopy(_MS_DEP_DIR_STRUCT))
 
-        self.assertIn('wants1.target', dep_unit.wants)
-        self.assertIn('wants2.target', dep_unit.wants)
-        self.assertIn('requires1.target', dep_unit.requires)
-        self.assertIn('requires2.target', dep_unit.requires)
-        self.assertIn('wants1.target', dep_unit.dependencies)
-        self.assertIn('wants2.target', dep_unit.dependencies)
-        self.assertIn('requires1.target', dep_unit.dependencies)
-        self.assertIn('requires2.target', dep_unit.dependencies)
+        self.assertLessEqual({'wants1.target', 'wants2.target'}, dep_unit.wants)
+        self.assertLessEqual({'requires1.target', 'requires2.target'}, dep_unit.requires)
+        self.assertLessEqual({'wants1.target', 'wants2.target', 'requires1.target', 'requires2.target'}, dep_unit.dependencies)
 
         self.assertFalse(hasattr(dep_unit, 'unit_file'))
         self.assertFalse(hasattr(dep_unit, 'd'))
         self.assertFalse(hasattr(dep_unit, 'file_type'))
 
-        self.assertNotIn('requires1.target', dep_unit.wants)
-        self.assertNotIn('config1.cfg', dep_unit.wants)
-        self.assertNotIn('test_unit.wants', dep_unit.wants)
-        self.assertNotIn('dep_dir', dep_unit.wants)
-        self.assertNotIn('wants1.target', dep_unit.requires)
-        self.assertNotIn('config1.cfg', dep_unit.requires)
-        self.assertNotIn('test_unit.wants', dep_unit.requires)
-        self.assertNotIn('dep_dir', dep_unit.requires)
+        self.assertTrue(dep_unit.wants.isdisjoint({'requires1.target', 'config1.cfg', 'test_unit.wants', 'dep_dir'}))
+        self.assertTrue(dep_unit.requires.isdisjoint({'wants1.target', 'config1.cfg', 'test_unit.wants', 'dep_dir'}))
 
 
     def test_update_ms_sym_link(self) -> None:
         '''Verify the actual parsing for master struct symbolic links is correct'''
 
-        test_sym_link_struct = {
-            "metadata": {
-                "unit_file": "sym_link.target",
-                "file_type": "sym_link",
-                "sym_link_path": "/etc/systemd/system/",
-                "sym_link_unit": "sym_link.target",
-                "sym_link_target_path": "/lib/systemd/system/",
-                "sym_link_target_unit": "target.target",
-                "dependencies": [ "target.target" ]
-            }
-        }
-
         test_ms_sym_link_unit = DepMapUnit('sym_link.target', 'None', 'None')
-        test_ms_sym_link_unit.update_ms_sym_link(test_sym_link_struct)
+        test_ms_sym_link_unit.update_ms_sym_link(deepcopy(_MS_SYM_LINK_STRUCT))
 
         self.assertTrue(test_ms_sym_link_unit.sym_linked_to == {'/lib/systemd/system/target.target'})
         self.assertTrue(test_ms_sym_link_unit.dependencies == {'target.target'})
@@ -130,37 +201,11 @@ class TestDepMapUnits(unittest.TestCase):
     def test_update_ms_unit_file(self) -> None:
         '''Verify the actual parsing for master struct unit files is correct'''
 
-        test_ms_unit_file_struct = {
-            "metadata": { "file_type": "unit_file" },
-            "Description": [ "Some random unit file" ],
-            "PartOf": [ "enabled.target", "lxdm.target" ],
-            "Wants": [ "graphical.target" ],
-            "Before": [ "enabled.target" ],
-            "OnFailure": [ "failure.service" ],
-            "OnSuccess": [ "success.service" ],
-            "Requisite": [ "default.target" ],
-            "Requires": [ "multi-user.target" ],
-            "LimitCORE": [ "infinity" ],
-            "BindsTo": [ "multi-user.target", "graphical.target" ],
-            "LimitNOFILE": [ "infinity " ],
-            "RuntimeDirectory": [ "dir" ],
-            "RuntimeDirectoryPreserve": [ "yes" ],
-            "ExecStartPre": [ "rm -f /var/lib/bin/*.frc", "rm -f /var/lib/bin_failover/*.frc" ],
-            "ExecStart": [ "/usr/bin/bin /run/bin/bin.cfg" ],
-            "ExecStopPost": [ "/usr/bin/watchdogtickle -a" ],
-            "Upholds": [ "default.target" ],
-            "Sockets": [ "socket.socket" ],
-            "Service": [ "service.service" ],
-            "WantedBy": [ "enabled.target" ]
-        }
-
         test_ms_unit_file = DepMapUnit('unit.target', 'None', 'None')
-        test_ms_unit_file.update_ms_unit_file(test_ms_unit_file_struct)
+        test_ms_unit_file.update_ms_unit_file(deepcopy(_MS_UNIT_FILE_STRUCT))
 
-        self.assertIn('enabled.target', test_ms_unit_file.partof)
-        self.assertIn('lxdm.target', test_ms_unit_file.partof)
-        self.assertIn('multi-user.target', test_ms_unit_file.bindsto)
-        self.assertIn('graphical.target', test_ms_unit_file.bindsto)
+        self.assertLessEqual({'enabled.target', 'lxdm.target'}, test_ms_unit_file.partof)
+        self.assertLessEqual({'multi-user.target', 'graphical.target'}, test_ms_unit_file.bindsto)
 
         self.assertTrue(test_ms_unit_file.requires == {'multi-user.target'})
         self.assertTrue(test_ms_unit_file.wants == {'graphical.target'})
@@ -197,15 +242,11 @@ class TestDepMapUnits(unittest.TestCase):
         with self.assertLogs('root', level='WARNING') as logs:
             logging.getLogger('root').warning('Invalid reverse dependency: invalid.  This does not map to any attribute sets')
 
-        self.assertIn('default.target', test_unit.parents)
-        self.assertIn('multi-user.target', test_unit.parents)
-        self.assertIn('graphical.target', test_unit.parents)
+        self.assertLessEqual({'default.target', 'multi-user.target', 'graphical.target'}, test_unit.parents)
         self.assertIn('default.target', test_unit.wanted_by)
         self.assertIn('multi-user.target', test_unit.required_by)
         self.assertIn('/etc/systemd/system/graphical.target', test_unit.sym_linked_from)
-        self.assertIn('wanted_by', test_unit.reverse_deps)
-        self.assertIn('required_by', test_unit.reverse_deps)
-        self.assertIn('sym_linked_from', test_unit.reverse_deps)
+        self.assertLessEqual({'wanted_by', 'required_by', 'sym_linked_from'}, test_unit.reverse_deps)
         
         self.assertEqual(logs.output, ['WARNING:root:Invalid reverse dependency: invalid.  This does not map to any attribute sets'])
 
@@ -215,56 +256,23 @@ class TestDepMapUnits(unittest.TestCase):
     def test_load_from_ms(self) -> None:
         '''Verify master struct entries are identified correctly.  See above for parsing verification'''
 
-        test_config_dir_entry = {
-            "metadata": { "file_type": "dep_dir" }
-        }
-        test_wants_dir_entry = {
-            "metadata": {
-                "file_type": "dep_dir",
-                "dependency_folder_paths": [ "/etc/systemd/system/timers.target.wants" ],
-                "Wants": [ "logrotate.timer", "hwclock-sync.timer" ]
-            }
-        }
-        test_requires_dir_entry = {
-            "metadata": {
-                "file_type": "dep_dir",
-                "dependency_folder_paths": [ "/etc/systemd/system/random.service.requires" ],
-                "Requires": [ "another.service" ]
-            }
-        }
-        test_sym_link_entry = {
-            "metadata": {
-                "file_type": "sym_link",
-                "sym_link_target_path": "/lib/systemd/system/",
-                "sym_link_target_unit": "rsyslog.service",
-                "dependencies": [ "rsyslog.service" ]
-            }
-        }
-        test_unit_file_entry = {
-            "metadata": { "file_type": "unit_file" },
-            "Requires": [ "syslog.socket" ]
-        }
-        test_invalid_file_entry = {
-            "metadata": { "file_type": "invalid" }
-        }
-
         test_unit = DepMapUnit('default.target', 'None', 'None')
-        test_unit.load_from_ms(test_config_dir_entry)
+        test_unit.load_from_ms(deepcopy(_MS_CONFIG_DIR_ENTRY))
 
-        test_unit.load_from_ms(test_wants_dir_entry)
+        test_unit.load_from_ms(deepcopy(_MS_WANTS_DIR_ENTRY))
         self.assertIn('logrotate.timer', test_unit.wants)
         self.assertIn('hwclock-sync.timer', test_unit.wants)
 
-        test_unit.load_from_ms(test_requires_dir_entry)
+        test_unit.load_from_ms(deepcopy(_MS_REQUIRES_DIR_ENTRY))
         self.assertTrue(test_unit.requires == {'another.service'})
 
-        test_unit.load_from_ms(test_sym_link_entry)
+        test_unit.load_from_ms(deepcopy(_MS_SYM_LINK_ENTRY))
         self.assertTrue(test_unit.sym_linked_to == {'/lib/systemd/system/rsyslog.service'})
 
-        test_unit.load_from_ms(test_unit_file_entry)
+        test_unit.load_from_ms(deepcopy(_MS_UNIT_FILE_ENTRY))
         self.assertIn('syslog.socket', test_unit.requires)
 
-        test_unit.load_from_ms(test_invalid_file_entry)
+        test_unit.load_from_ms(deepcopy(_MS_INVALID_FILE_ENTRY))
         with self.assertLogs('root', level='WARNING') as logs:
             logging.getLogger('root').warning('Not sure how to parse file type: invalid from default.target')
         self.assertEqual(logs.output, ['WARNING:root:Not sure how to parse file type: invalid from default.target'])
@@ -273,18 +281,8 @@ class TestDepMapUnits(unittest.TestCase):
     def test_load_from_dep_map(self) -> None:
         '''Verifying correct loading of previously recorded dependency map entries.  See above for parsing verification'''
 
-        test_old_dep_map_entry = {
-            "unit_name": "multi-user.target",
-            "parents": [ "enabled.target" ],
-            "reverse_deps": [ "required_by" ],
-            "Wants": [ "gfarmond.service", "rngd.service", "dnsmasq.service" ],
-            "Requires": [ "basic.target" ],
-            "required_by": [ "graphical.target" ],
-            "dependencies": [ "gfarmond.service", "rngd.service", "dnsmasq.service", "basic.target" ]
-        }
-
         test_unit = DepMapUnit('multi-user.target', 'default.target', 'required_by')
-        test_unit.load_from_dep_map(test_old_dep_map_entry)
+        test_unit.load_from_dep_map(deepcopy(_OLD_DEP_MAP_ENTRY))
         with self.assertLogs('root', level='WARNING') as logs:
             logging.getLogger('root').warning('Could not load "{dep}" attribute from unit already in dep map.  If this is not "unit_file" investigate')
 
@@ -292,17 +290,10 @@ class TestDepMapUnits(unittest.TestCase):
         self.assertTrue(test_unit.reverse_deps == {'required_by'})
         self.assertTrue(test_unit.requires == {'basic.target'})
 
-        self.assertIn('default.target', test_unit.required_by)
-        self.assertIn('graphical.target', test_unit.required_by)
-        self.assertIn('enabled.target', test_unit.parents)
-        self.assertIn('default.target', test_unit.parents)
-        self.assertIn('gfarmond.service', test_unit.wants)
-        self.assertIn('rngd.service', test_unit.wants)
-        self.assertIn('dnsmasq.service', test_unit.wants)
-        self.assertIn('gfarmond.service', test_unit.dependencies)
-        self.assertIn('rngd.service', test_unit.dependencies)
-        self.assertIn('dnsmasq.service', test_unit.dependencies)
-        self.assertIn('basic.target', test_unit.dependencies)
+        self.assertLessEqual({'default.target', 'graphical.target'}, test_unit.required_by)
+        self.assertLessEqual({'enabled.target', 'default.target'}, test_unit.parents)
+        self.assertLessEqual({'gfarmond.service', 'rngd.service', 'dnsmasq.service'}, test_unit.wants)
+        self.assertLessEqual({'gfarmond.service', 'rngd.service', 'dnsmasq.service', 'basic.target'}, test_unit.dependencies)
 
         self.assertEqual(logs.output, ['WARNING:root:Could not load "{dep}" attribute from unit already in dep map.  If this is not "unit_file" investigate'])
 
@@ -333,18 +324,36 @@ class TestDepMapUnits(unittest.TestCase):
 
         test_dep_tups_list = test_unit.create_dep_tups('test.target')
 
-        self.assertIn(('wants.target', 'test.target', 'wanted_by'), test_dep_tups_list)
-        self.assertIn(('requires.target', 'test.target', 'required_by'), test_dep_tups_list)
-        self.assertIn(('requisite.target', 'test.target', 'requisite_of'), test_dep_tups_list)
-        self.assertIn(('bindsto.target', 'test.target', 'bound_by'), test_dep_tups_list)
-        self.assertIn(('partof.target', 'test.target', 'has_part'), test_dep_tups_list)
-        self.assertIn(('upholds.target', 'test.target', 'upheld_by'), test_dep_tups_list)
-        self.assertIn(('onsuccess.target', 'test.target', 'on_success_of'), test_dep_tups_list)
-        self.assertIn(('sockets.socket', 'test.target', 'socket_of'), test_dep_tups_list)
-        self.assertIn(('service.service', 'test.target', 'uses_service'), test_dep_tups_list)
-        self.assertIn(('timer.service', 'test.target', 'has_timer'), test_dep_tups_list)
-        self.assertIn(('socket.service', 'test.target', 'has_socket'), test_dep_tups_list)
-        self.assertIn(('path.service', 'test.target', 'needs_path'), test_dep_tups_list)
+        self.assertLessEqual(_EXPECTED_TUPS, set(test_dep_tups_list))
+
+
+    def test_create_dep_tups_strips_paths(self) -> None:
+        '''Verify dependency tuples only carry unit names, whichever attribute the dependency came from'''
+
+        test_unit = DepMapUnit('test.target', 'None', 'None')
+        test_unit.wants = {'/etc/systemd/system/wants.target'}
+        test_unit.sym_linked_to = {'/lib/systemd/system/sym_link.target'}
+
+        test_dep_tups_list = test_unit.create_dep_tups('test.target')
+
+        self.assertEqual(test_dep_tups_list, [
+            ('sym_link.target', 'test.target', 'sym_linked_from'),
+            ('wants.target', 'test.target', 'wanted_by')
+            ])
+
+
+    def test_freeze(self) -> None:
+        '''Verify freeze makes every set attribute read-only without losing its contents'''
+
+        test_unit = DepMapUnit('multi-user.target', 'default.target', 'wanted_by')
+        test_unit.load_from_ms(deepcopy(_MS_UNIT_FILE_ENTRY))
+        test_unit.freeze()
+
+        self.assertIsInstance(test_unit.wants, frozenset)
+        self.assertIsInstance(test_unit.dependencies, frozenset)
+        self.assertEqual(test_unit.requires, {'syslog.socket'})
+        self.assertEqual(test_unit.wanted_by, {'default.target'})
+        self.assertIn('requires', test_unit.get_significant_attributes())
 
 
     def test_get_significant_attributes(self) -> None:
@@ -353,9 +362,7 @@ class TestDepMapUnits(unittest.TestCase):
         test_unit = DepMapUnit('default.target', '/path/to/default.target', 'required_by')
         significant_attributes = test_unit.get_significant_attributes()
 
-        self.assertIn('unit_name', significant_attributes)
-        self.assertIn('parents', significant_attributes)
-        self.assertIn('reverse_deps', significant_attributes)
+        self.assertLessEqual({'unit_name', 'parents', 'reverse_deps'}, set(significant_attributes))
 
         self.assertNotIn('parent_unit_path', significant_attributes)
 
@@ -364,9 +371,7 @@ class TestDepMapUnits(unittest.TestCase):
         test_unit.required_by = {'unit6.target'}
         significant_attributes: List = test_unit.get_significant_attributes()
 
-        self.assertIn('wants', significant_attributes)
-        self.assertIn('requires', significant_attributes)
-        self.assertIn('required_by', significant_attributes)
+        self.assertLessEqual({'wants', 'requires', 'required_by'}, set(significant_attributes))
 
 
     def test_dep_map_unit_record(self) -> None:
@@ -382,40 +387,17 @@ class TestDepMapUnits(unittest.TestCase):
 
         out_struct = test_unit.record()
 
-        self.assertTrue(isinstance(out_struct, dict))
-
-        self.assertIn('unit_name', out_struct)
-        self.assertIn('parents', out_struct)
-        self.assertIn('reverse_deps', out_struct)
-        self.assertIn('requires', out_struct)
-        self.assertIn('sockets', out_struct)
-        self.assertIn('uses_service', out_struct)
-        self.assertIn('service', out_struct)
-        self.assertIn('wanted_by', out_struct)
+        self.assertIsInstance(out_struct, dict)
+        self.assertGreaterEqual(out_struct.keys(), {'unit_name', 'parents', 'reverse_deps', *_RECORDED_SET_ATTRS})
 
-        self.assertTrue(isinstance(out_struct['requires'], list))
-        self.assertTrue(isinstance(out_struct['sockets'], list))
-        self.assertTrue(isinstance(out_struct['uses_service'], list))
-        self.assertTrue(isinstance(out_struct['service'], list))
-        self.assertTrue(isinstance(out_struct['wanted_by'], list))
+        for attribute in _RECORDED_SET_ATTRS:
+            self.assertIsInstance(out_struct[attribute], list)
 
 
 def get_dep_map_unit_tests() -> unittest.TestSuite:
     '''Create a test suite to test all dep map unit functions'''
 
-    dep_map_test_suite = unittest.TestSuite()
-    dep_map_test_suite.addTest(TestDepMapUnits('test_DepMapUnit_creation'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_update_ms_dep_dir'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_update_ms_sym_link'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_update_ms_unit_file'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_set_rev_dep'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_load_from_ms'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_load_from_dep_map'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_create_dep_tups'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_get_significant_attributes'))
-    dep_map_test_suite.addTest(TestDepMapUnits('test_dep_map_unit_record'))
-
-    return dep_map_test_suite
+    return unittest.TestLoader().loadTestsFromTestCase(TestDepMapUnits)
 
 
 def main() -> None: